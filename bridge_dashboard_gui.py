@@ -6,17 +6,25 @@ A modern GUI dashboard for monitoring and managing the keyword synchronization s
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk, scrolledtext, filedialog
+import json
+import logging
+import os
 import subprocess
 import sys
 from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import threading
 import time
 
 # Import from the main script
 import bridge_keywords_to_tags as bkt
 
+_LOG_PATH = Path.home() / "Library" / "Logs" / "bridge-keywords-watcher.log"
+_SCRIPT_PATH = Path(__file__).resolve().parent / "bridge_keywords_to_tags.py"
+
+log = logging.getLogger(__name__)
+
 
 class BridgeDashboard:
     def __init__(self, root):
@@ -83,9 +91,9 @@ class BridgeDashboard:
         dirs_frame.columnconfigure(0, weight=1)
         
         # Scrollbar for listbox
-        scrollbar = ttk.Scrollbar(dirs_frame, orient=tk.VERTICAL, command=self.dirs_listbox.yview)
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.dirs_listbox.config(yscrollcommand=scrollbar.set)
+        self.dirs_scrollbar = ttk.Scrollbar(dirs_frame, orient=tk.VERTICAL, command=self.dirs_listbox.yview)
+        self.dirs_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.dirs_listbox.config(yscrollcommand=self.dirs_scrollbar.set)
         
         # Add/Remove buttons
         dir_buttons = ttk.Frame(dirs_frame)
@@ -126,11 +134,63 @@ class BridgeDashboard:
         # Status bar
         self.status_bar = ttk.Label(main_frame, text="Ready", relief=tk.SUNKEN)
         self.status_bar.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 0))
-        
-        # Start auto-refresh
+
+        # Incremental log-reader state: where we left off and which inode we
+        # were reading, so refreshes only pull new bytes
+        self._log_offset = 0
+        self._log_inode = None
+
+        # (timestamp, value) TTL cache around bkt.service_status()
+        self._status_cache = (0.0, None)
+
+        # Single worker serializing all service/config actions: no per-click
+        # thread spawn and no overlapping launchctl calls racing each other
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='bkt-svc')
+        self._refresh_inflight = False
+
+        # (sidecar, script) mtimes at the last config render, and the
+        # configured directory list as shown in the listbox
+        self._config_mtime = None
+        self._watch_paths = []
+
+        # Initial refresh, then event-driven updates: fswatch tells us when
+        # the log or config actually changed, and a slow heartbeat keeps the
+        # service status current. Falls back to 10s polling without fswatch.
+        self._after_id = None
+        self._closing = False
         self.refresh_status()
-        self.auto_refresh()
+        self._fswatch_proc = None
+        if self._start_change_watcher():
+            self._heartbeat_status()
+        else:
+            self.auto_refresh()
+
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Tear down timers and workers so close doesn't leave work behind."""
+        self._closing = True
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        if self._fswatch_proc is not None:
+            self._fswatch_proc.terminate()
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
     
+    def _cached_status(self):
+        """Service status with a 2s TTL so bursts don't each fork launchctl."""
+        now = time.monotonic()
+        ts, value = self._status_cache
+        if value is not None and now - ts < 2.0:
+            return value
+        value = bkt.service_status()
+        self._status_cache = (now, value)
+        return value
+
+    def _invalidate_status(self):
+        """Drop the cached status after a start/stop/restart changed it."""
+        self._status_cache = (0.0, None)
+
     def update_status_display(self, status):
         """Update the status display."""
         if status == 'running':
@@ -160,75 +220,167 @@ class BridgeDashboard:
         
         self.status_label.config(text=status_text, foreground=status_color)
     
-    def update_config_display(self):
+    def update_config_display(self, watch_paths=None):
         """Update the configuration display."""
-        watch_paths = bkt.get_configured_watch_paths()
-        
+        # Skip the widget rebuild entirely when neither the sidecar nor the
+        # script (which holds the marker/mode scalars) changed since the
+        # last render — the common case on idle refreshes
+        try:
+            sidecar_mtime = os.stat(bkt.CONFIG_PATH).st_mtime
+        except FileNotFoundError:
+            sidecar_mtime = 0.0
+        try:
+            script_mtime = os.stat(bkt.__file__).st_mtime
+        except OSError:
+            script_mtime = 0.0
+        mtimes = (sidecar_mtime, script_mtime)
+        if mtimes == self._config_mtime:
+            return
+        self._config_mtime = mtimes
+
+        if watch_paths is None:
+            watch_paths = bkt.load_watch_directories()
+
         config_text = f"Strip prefixes: {'Yes' if bkt.STRIP_HIERARCHICAL_PREFIXES else 'No'}\n"
         config_text += f"Replace mode: {'Yes' if bkt.WATCH_REPLACE_MODE else 'No (merge)'}\n"
         config_text += f"Marker keyword: {'sync' if bkt.MARKER_KEYWORD else 'None (all files)'}"
-        
+
         self.config_text.config(state=tk.NORMAL)
         self.config_text.delete(1.0, tk.END)
         self.config_text.insert(1.0, config_text)
         self.config_text.config(state=tk.DISABLED)
-        
-        # Update directories listbox
-        self.dirs_listbox.delete(0, tk.END)
-        for path in watch_paths:
-            self.dirs_listbox.insert(tk.END, str(path))
+
+        # The listbox mirrors the configured list entry-for-entry, so a
+        # selection index maps straight back to the config; rewrite only
+        # when the contents actually differ
+        self._watch_paths = [str(p) for p in watch_paths]
+        new_entries = tuple(self._watch_paths)
+        if new_entries != self.dirs_listbox.get(0, tk.END):
+            # Detach the scrollbar during the rebuild and insert all entries
+            # in one Tcl round-trip instead of one per item
+            self.dirs_listbox.configure(yscrollcommand='')
+            self.dirs_listbox.delete(0, tk.END)
+            if new_entries:
+                self.dirs_listbox.insert(tk.END, *new_entries)
+            self.dirs_listbox.configure(yscrollcommand=self.dirs_scrollbar.set)
     
-    def load_logs(self):
-        """Load recent logs."""
-        log_path = Path.home() / "Library" / "Logs" / "bridge-keywords-watcher.log"
-        
-        if not log_path.exists():
-            self.log_text.delete(1.0, tk.END)
-            self.log_text.insert(1.0, "No logs available. Service hasn't been started yet.")
-            return
-        
+    def _read_log_update(self):
+        """Read any new log output; call only from the executor worker.
+
+        The offset/inode state below assumes one reader at a time, which
+        the single-worker executor guarantees.
+        Tracks the file offset and inode between reads so each call only
+        pulls the bytes written since last time; a full (bounded) tail reload
+        happens only on first read or after log rotation. Returns a
+        (reset, text) tuple for _apply_log_update, or None when there is
+        nothing new.
+        """
+        log_path = _LOG_PATH
+
         try:
-            # Read last 100 lines
-            result = subprocess.run(['tail', '-100', str(log_path)], 
-                                    capture_output=True, text=True, timeout=2)
-            
-            self.log_text.delete(1.0, tk.END)
-            if result.stdout:
-                self.log_text.insert(1.0, result.stdout)
-                self.log_text.see(tk.END)  # Scroll to bottom
-            else:
-                self.log_text.insert(1.0, "Log file is empty.")
+            # One stat covers the existence check and gives us size/inode
+            # for the incremental read — no separate exists() round-trip
+            st = os.stat(log_path)
+        except FileNotFoundError:
+            self._log_offset = 0
+            self._log_inode = None
+            return (True, "No logs available. Service hasn't been started yet.")
+
+        try:
+            with open(log_path, 'rb') as f:
+                if st.st_ino != self._log_inode or st.st_size < self._log_offset:
+                    # First read, or the log was rotated/truncated: reload a
+                    # bounded tail rather than the whole file
+                    start = max(0, st.st_size - 8192)
+                    f.seek(start)
+                    data = f.read()
+                    if start:
+                        data = data.split(b'\n', 1)[-1]  # Align to a full line
+                    self._log_inode = st.st_ino
+                    self._log_offset = f.tell()
+                    return (True, data.decode('utf-8', 'replace') or "Log file is empty.")
+
+                # Append only the new bytes
+                f.seek(self._log_offset)
+                data = f.read()
+                self._log_offset = f.tell()
+                if not data:
+                    return None
+                return (False, data.decode('utf-8', 'replace'))
         except Exception as e:
+            self._log_offset = 0
+            self._log_inode = None
+            return (True, f"Error loading logs: {str(e)}")
+
+    def _apply_log_update(self, update):
+        """Apply a _read_log_update result to the widget (UI thread only)."""
+        if update is None:
+            return
+        reset, text = update
+        if reset:
             self.log_text.delete(1.0, tk.END)
-            self.log_text.insert(1.0, f"Error loading logs: {str(e)}")
+            self.log_text.insert(1.0, text)
+        else:
+            self.log_text.insert(tk.END, text)
+        self.log_text.see(tk.END)  # Scroll to bottom
+        # Keep the widget bounded (no-op until it exceeds 2000 lines)
+        self.log_text.delete('1.0', 'end-2000l')
+
+    def load_logs(self):
+        """Load new log output incrementally.
+
+        The read runs on the single-worker executor — the same thread
+        refresh_status reads from — so the offset/inode state never has
+        two readers racing; only the widget update hops back to the UI.
+        """
+        def read_thread():
+            update = self._read_log_update()
+            if update is not None:
+                self.root.after(0, self._apply_log_update, update)
+
+        self._executor.submit(read_thread)
     
     def refresh_status(self):
         """Refresh all status information."""
+        if self._refresh_inflight:
+            return  # A refresh is already queued; don't pile more behind it
+        self._refresh_inflight = True
+
         def refresh_thread():
             try:
-                status = bkt.service_status()
-                self.root.after(0, lambda: self.update_status_display(status))
-                self.root.after(0, self.update_config_display)
-                self.root.after(0, self.load_logs)
-                self.root.after(0, lambda: self.status_bar.config(
-                    text=f"Last updated: {datetime.now().strftime('%H:%M:%S')}"))
+                # Gather everything off-thread (subprocess, config parse,
+                # log read), then mutate the widgets in one UI callback
+                status = self._cached_status()
+                watch_paths = bkt.load_watch_directories()
+                log_update = self._read_log_update()
+                timestamp = time.strftime('%H:%M:%S')
+                self.root.after(0, self._apply_snapshot,
+                                status, watch_paths, log_update, timestamp)
             except Exception as e:
                 self.root.after(0, lambda: self.status_bar.config(
                     text=f"Error: {str(e)}"))
-        
-        threading.Thread(target=refresh_thread, daemon=True).start()
+            finally:
+                self._refresh_inflight = False
+
+        self._executor.submit(refresh_thread)
+
+    def _apply_snapshot(self, status, watch_paths, log_update, timestamp):
+        """Apply a refresh snapshot to all widgets in a single pass."""
+        self.update_status_display(status)
+        self.update_config_display(watch_paths)
+        self._apply_log_update(log_update)
+        self.status_bar.config(text=f"Last updated: {timestamp}")
     
     def start_service(self):
         """Start the service."""
         def start_thread():
             try:
-                script_path = Path(__file__).parent / "bridge_keywords_to_tags.py"
-                
                 # Install if needed
-                if bkt.service_status() == 'not-installed':
-                    bkt.service_install(script_path, autostart=False)
+                if self._cached_status() == 'not-installed':
+                    bkt.service_install(_SCRIPT_PATH, autostart=False)
                 
                 if bkt.service_start():
+                    self._invalidate_status()
                     self.root.after(0, lambda: self.status_bar.config(
                         text="Service started successfully"))
                     self.root.after(1000, self.refresh_status)
@@ -236,13 +388,14 @@ class BridgeDashboard:
                 self.root.after(0, lambda: self.status_bar.config(
                     text=f"Error: {str(e)}"))
         
-        threading.Thread(target=start_thread, daemon=True).start()
+        self._executor.submit(start_thread)
     
     def stop_service(self):
         """Stop the service."""
         def stop_thread():
             try:
                 if bkt.service_stop():
+                    self._invalidate_status()
                     self.root.after(0, lambda: self.status_bar.config(
                         text="Service stopped successfully"))
                     self.root.after(1000, self.refresh_status)
@@ -250,13 +403,14 @@ class BridgeDashboard:
                 self.root.after(0, lambda: self.status_bar.config(
                     text=f"Error: {str(e)}"))
         
-        threading.Thread(target=stop_thread, daemon=True).start()
+        self._executor.submit(stop_thread)
     
     def restart_service(self):
         """Restart the service."""
         def restart_thread():
             try:
                 if bkt.service_restart():
+                    self._invalidate_status()
                     self.root.after(0, lambda: self.status_bar.config(
                         text="Service restarted successfully"))
                     self.root.after(2000, self.refresh_status)
@@ -264,141 +418,150 @@ class BridgeDashboard:
                 self.root.after(0, lambda: self.status_bar.config(
                     text=f"Error: {str(e)}"))
         
-        threading.Thread(target=restart_thread, daemon=True).start()
+        self._executor.submit(restart_thread)
     
+    def _start_change_watcher(self) -> bool:
+        """Watch the log and config for changes with fswatch (FSEvents).
+
+        Returns False when fswatch isn't available, in which case the caller
+        falls back to timed polling.
+        """
+        fswatch_path = None
+        for candidate in ['/opt/homebrew/bin/fswatch', '/usr/local/bin/fswatch', '/usr/bin/fswatch']:
+            if Path(candidate).exists():
+                fswatch_path = candidate
+                break
+        if not fswatch_path:
+            return False
+
+        # Watch the sidecar's directory rather than the file: the sidecar
+        # is written via rename and may not exist yet on a fresh install
+        config_dir = bkt.CONFIG_PATH.parent
+        config_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            self._fswatch_proc = subprocess.Popen(
+                [fswatch_path, '-0', str(_LOG_PATH), str(_SCRIPT_PATH), str(config_dir)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return False
+
+        def watch_thread():
+            config_prefix = str(config_dir)
+            buffer = b''
+            while True:
+                chunk = self._fswatch_proc.stdout.read(4096)
+                if not chunk:
+                    break  # fswatch exited
+                buffer += chunk
+                *events, buffer = buffer.split(b'\0')
+                for event in events:
+                    changed = event.decode('utf-8', 'replace')
+                    if changed.endswith('.py') or changed.startswith(config_prefix):
+                        self.root.after(0, self.update_config_display)
+                    else:
+                        self.root.after(0, self.load_logs)
+            # fswatch died (crashed, killed, or refused a watch target);
+            # revert to timed polling instead of going update-less
+            if not self._closing:
+                try:
+                    self.root.after(0, self._fall_back_to_polling)
+                except tk.TclError:
+                    pass  # window already torn down
+
+        threading.Thread(target=watch_thread, daemon=True).start()
+        return True
+
+    def _fall_back_to_polling(self):
+        """Swap the dead fswatch stream for the 10s polling loop."""
+        if self._closing:
+            return
+        log.debug("fswatch exited; falling back to polling")
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._fswatch_proc = None
+        self.auto_refresh()
+
+    def _heartbeat_status(self):
+        """Slow heartbeat for the service status; file updates are event-driven."""
+        def heartbeat_thread():
+            try:
+                status = self._cached_status()
+                self.root.after(0, lambda: self.update_status_display(status))
+            except Exception:
+                pass
+
+        self._executor.submit(heartbeat_thread)
+        self._after_id = self.root.after(60000, self._heartbeat_status)
+
     def auto_refresh(self):
-        """Auto-refresh every 10 seconds."""
+        """Auto-refresh every 10 seconds (fallback when fswatch is missing)."""
         self.refresh_status()
-        self.root.after(10000, self.auto_refresh)
+        self._after_id = self.root.after(10000, self.auto_refresh)
     
+    def _write_watch_config(self, dirs):
+        """Atomically write the watch-directory list to the JSON sidecar."""
+        bkt.CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write a sibling temp file and rename over the target so a crash
+        # mid-write can never leave a truncated config behind
+        tmp = bkt.CONFIG_PATH.with_suffix('.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(dirs, f, indent=2)
+        os.replace(tmp, bkt.CONFIG_PATH)
+
     def add_directory(self):
-        """Add a directory using native macOS folder picker."""
-        def add_async():
-            try:
-                print("[DEBUG] Starting add_directory")
-                # Use AppleScript to show folder picker and return POSIX path directly
-                applescript = '''
-                tell application "System Events"
-                    activate
-                    set selectedFolder to choose folder with prompt "Select a folder to watch:"
-                    return POSIX path of selectedFolder
-                end tell
-                '''
-                print("[DEBUG] Running AppleScript...")
-                result = subprocess.run(
-                    ['osascript', '-e', applescript],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                
-                print(f"[DEBUG] AppleScript return code: {result.returncode}")
-                print(f"[DEBUG] AppleScript stdout: {result.stdout}")
-                print(f"[DEBUG] AppleScript stderr: {result.stderr}")
-                
-                if result.returncode != 0:
-                    print("[DEBUG] User cancelled or error")
-                    self.root.after(0, lambda: self.status_bar.config(text="Folder selection cancelled"))
-                    return  # User cancelled
-                
-                # Get POSIX path directly from AppleScript
-                posix_path = result.stdout.strip()
-                print(f"[DEBUG] POSIX path: {posix_path}")
-                
-                if not posix_path:
-                    print("[DEBUG] Empty path!")
-                    self.root.after(0, lambda: self.status_bar.config(text="Error: Could not get folder path"))
-                    return
-                
-                # Read current config
-                print("[DEBUG] Reading config file...")
-                script_path = Path(__file__).parent / "bridge_keywords_to_tags.py"
-                with open(script_path, 'r') as f:
-                    content = f.read()
-                
-                # Find WATCH_DIRECTORIES and add new path
-                print("[DEBUG] Searching for WATCH_DIRECTORIES...")
-                import re
-                match = re.search(r'WATCH_DIRECTORIES = \[(.*?)\]', content, re.DOTALL)
-                if match:
-                    print("[DEBUG] Found WATCH_DIRECTORIES")
-                    dirs_content = match.group(1)
-                    # Add new directory
-                    new_line = f'    "{posix_path}",\n'
-                    if dirs_content.strip():
-                        new_dirs = dirs_content.rstrip() + '\n' + new_line
-                    else:
-                        new_dirs = '\n' + new_line
-                    
-                    print(f"[DEBUG] New dirs content: {new_dirs[:100]}...")
-                    
-                    new_content = content.replace(
-                        f'WATCH_DIRECTORIES = [{dirs_content}]',
-                        f'WATCH_DIRECTORIES = [{new_dirs}]'
-                    )
-                    
-                    print("[DEBUG] Writing to file...")
-                    with open(script_path, 'w') as f:
-                        f.write(new_content)
-                    print("[DEBUG] File written successfully!")
-                    
-                    self.root.after(0, lambda: self.status_bar.config(text=f"Added: {posix_path}"))
-                    self.root.after(0, self.refresh_status)
-                    
-                    # Reload the module
-                    print("[DEBUG] Reloading module...")
-                    import importlib
-                    importlib.reload(bkt)
-                    print("[DEBUG] Module reloaded!")
-                else:
-                    print("[DEBUG] WATCH_DIRECTORIES not found in file!")
-                    self.root.after(0, lambda: self.status_bar.config(text="Error: Could not find WATCH_DIRECTORIES"))
-            except Exception as e:
-                self.root.after(0, lambda: self.status_bar.config(text=f"Error: {str(e)}"))
-        
-        threading.Thread(target=add_async, daemon=True).start()
-    
+        """Add a directory using the native folder picker."""
+        try:
+            # Tk's dialog is native on macOS and needs no subprocess; it runs
+            # its own event loop so the UI stays responsive while it is open
+            posix_path = filedialog.askdirectory(
+                parent=self.root,
+                title="Select a folder to watch"
+            )
+            if not posix_path:
+                self.status_bar.config(text="Folder selection cancelled")
+                return
+
+            # Append to the JSON sidecar — a tiny write instead of
+            # regex-editing and reloading the bridge script
+            dirs = bkt.load_watch_directories()
+            if posix_path not in dirs:
+                dirs.append(posix_path)
+                self._write_watch_config(dirs)
+            log.debug("Added watch directory %s", posix_path)
+
+            self.status_bar.config(text=f"Added: {posix_path}")
+            self.refresh_status()
+        except Exception as e:
+            self.status_bar.config(text=f"Error: {str(e)}")
+
     def remove_directory(self):
         """Remove selected directory."""
         selection = self.dirs_listbox.curselection()
         if not selection:
             self.status_bar.config(text="Please select a directory to remove")
             return
-        
-        def remove_async():
-            try:
-                selected_path = self.dirs_listbox.get(selection[0])
-                
-                # Read current config
-                script_path = Path(__file__).parent / "bridge_keywords_to_tags.py"
-                with open(script_path, 'r') as f:
-                    content = f.read()
-                
-                # Remove the line containing this path
-                lines = content.split('\n')
-                new_lines = []
-                for line in lines:
-                    if selected_path not in line or 'WATCH_DIRECTORIES' in line:
-                        new_lines.append(line)
-                
-                new_content = '\n'.join(new_lines)
-                
-                with open(script_path, 'w') as f:
-                    f.write(new_content)
-                
-                self.root.after(0, lambda: self.status_bar.config(text=f"Removed: {selected_path}"))
-                self.root.after(0, self.refresh_status)
-                
-                # Reload the module
-                import importlib
-                importlib.reload(bkt)
-            except Exception as e:
-                self.root.after(0, lambda: self.status_bar.config(text=f"Error: {str(e)}"))
-        
-        threading.Thread(target=remove_async, daemon=True).start()
+
+        try:
+            # The listbox mirrors self._watch_paths, so the selection index
+            # deletes the entry directly — no path matching needed
+            idx = selection[0]
+            selected_path = self._watch_paths.pop(idx)
+            self._write_watch_config(self._watch_paths)
+            self.dirs_listbox.delete(idx)
+            log.debug("Removed watch directory %s", selected_path)
+
+            self.status_bar.config(text=f"Removed: {selected_path}")
+            self.refresh_status()
+        except Exception as e:
+            self.status_bar.config(text=f"Error: {str(e)}")
 
 
 def main():
+    logging.basicConfig(level=logging.INFO)
+
     # Check if running on macOS
     if sys.platform != 'darwin':
         print("Error: This dashboard only works on macOS")
@@ -12,15 +12,25 @@ Requirements:
 """
 
 import subprocess
+import functools
 import json
+import logging
+import logging.handlers
 import os
 import sys
 import plistlib
 import argparse
+import atexit
+import queue
+import select
+import stat
+import threading
 import time
 import signal
 from pathlib import Path
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 
 # ============================================================================
@@ -53,6 +63,9 @@ STRIP_HIERARCHICAL_PREFIXES = True
 MARKER_KEYWORD = "sync"
 # ============================================================================
 
+# Lowercased once here rather than per keyword in the filter comprehensions
+_MARKER_LOWER = MARKER_KEYWORD.lower() if MARKER_KEYWORD else None
+
 
 def send_notification(title: str, message: str, subtitle: str = ""):
     """Send a macOS notification."""
@@ -66,15 +79,16 @@ def send_notification(title: str, message: str, subtitle: str = ""):
 
 
 # File extensions to process (common image/video formats that support XMP)
-SUPPORTED_EXTENSIONS = {
+SUPPORTED_EXTENSIONS = frozenset({
     '.jpg', '.jpeg', '.png', '.tiff', '.tif', '.gif', '.bmp',
     '.psd', '.ai', '.eps', '.pdf',
     '.raw', '.cr2', '.cr3', '.nef', '.arw', '.orf', '.rw2', '.dng',
     '.mov', '.mp4', '.avi', '.mkv',
     '.xmp'  # Sidecar files
-}
+})
 
 
+@functools.lru_cache(maxsize=1)
 def check_exiftool():
     """Check if exiftool is installed."""
     try:
@@ -84,11 +98,91 @@ def check_exiftool():
         return False
 
 
-def get_xmp_keywords(file_path: Path, strip_prefixes: bool = STRIP_HIERARCHICAL_PREFIXES, debug: bool = False) -> list[str]:
-    """Extract XMP keywords from a file using exiftool."""
+# Arguments shared by every metadata read. -fast2 stops exiftool after the
+# header/IFD0 regions (no maker-note or trailer scans), and scoping each tag
+# to its group keeps it from searching others; the JSON keys are unchanged.
+_EXIFTOOL_ARGS = ['-fast2', '-json', '-XMP-dc:Subject', '-IPTC:Keywords', '-XMP-lr:HierarchicalSubject']
+
+
+class ExifToolSession:
+    """A long-lived exiftool process in -stay_open batch mode.
+
+    Spawning exiftool per file pays Perl interpreter startup for every
+    query, which dominates wall time on large folders. One resident
+    process answers all queries: query() writes the arguments to stdin
+    and reads stdout until exiftool's {ready} sentinel.
+    """
+
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            ['exiftool', '-stay_open', 'True', '-@', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+
+    def query(self, file_path: Path) -> dict:
+        """Read keyword metadata for a file; returns {} on any failure."""
+        args = _EXIFTOOL_ARGS + [str(file_path)]
+        try:
+            self._proc.stdin.write('\n'.join(args) + '\n-execute\n')
+            self._proc.stdin.flush()
+            lines = []
+            while True:
+                line = self._proc.stdout.readline()
+                if not line or line.startswith('{ready'):
+                    break
+                lines.append(line)
+            data = json.loads(''.join(lines))
+            return data[0] if data else {}
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def close(self):
+        """Ask exiftool to exit and reap the process."""
+        try:
+            self._proc.stdin.write('-stay_open\nFalse\n')
+            self._proc.stdin.flush()
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_EXIFTOOL_DAEMON = None
+
+
+def _exiftool_daemon() -> ExifToolSession:
+    """Return the process-wide exiftool session, starting it on first use.
+
+    Reused across single-file CLI calls and watcher batches so the
+    process spawns exiftool once for its lifetime; atexit shuts it down.
+    """
+    global _EXIFTOOL_DAEMON
+    if _EXIFTOOL_DAEMON is None:
+        _EXIFTOOL_DAEMON = ExifToolSession()
+        atexit.register(_EXIFTOOL_DAEMON.close)
+    return _EXIFTOOL_DAEMON
+
+
+def _read_keyword_metadata(file_path: Path, session: ExifToolSession = None, debug: bool = False) -> dict:
+    """Fetch the keyword metadata dict for a file.
+
+    Uses the shared exiftool session when one is provided; otherwise falls
+    back to a one-shot subprocess.
+    """
+    if session is not None:
+        return session.query(file_path)
     try:
         result = subprocess.run(
-            ['exiftool', '-json', '-Subject', '-Keywords', '-HierarchicalSubject', str(file_path)],
+            ['exiftool'] + _EXIFTOOL_ARGS + [str(file_path)],
             capture_output=True,
             text=True,
             check=True
@@ -96,63 +190,119 @@ def get_xmp_keywords(file_path: Path, strip_prefixes: bool = STRIP_HIERARCHICAL_
         if debug:
             print(f"  → exiftool stdout: {result.stdout[:300]}...")
         data = json.loads(result.stdout)
-        if not data:
-            if debug:
-                print(f"  → No data returned from exiftool")
-            return []
-        
-        metadata = data[0]
-        keywords = set()
-        
-        # Collect keywords from Keywords and Subject fields only
-        # HierarchicalSubject is NOT used because it can contain stale keywords
-        # that Adobe Bridge no longer displays (Bridge uses Keywords/Subject)
-        for field in ['Subject', 'Keywords']:
-            if field in metadata:
-                value = metadata[field]
-                if isinstance(value, list):
-                    for item in value:
-                        keywords.add(str(item))
-                elif isinstance(value, str):
-                    keywords.add(value)
-        
-        return list(keywords)
+        return data[0] if data else {}
     except subprocess.CalledProcessError as e:
         if debug:
             print(f"  → exiftool error (exit {e.returncode}): {e.stderr if e.stderr else 'no stderr'}")
-        return []
+        return {}
     except (json.JSONDecodeError, KeyError) as e:
         if debug:
-            print(f"  → Exception in get_xmp_keywords: {type(e).__name__}: {e}")
+            print(f"  → Exception reading metadata: {type(e).__name__}: {e}")
+        return {}
+
+
+def _keywords_from_metadata(metadata: dict) -> list[str]:
+    """Collect keywords from a metadata dict.
+
+    Only the Keywords and Subject fields are used; HierarchicalSubject is
+    NOT, because it can contain stale keywords that Adobe Bridge no longer
+    displays (Bridge uses Keywords/Subject).
+    """
+    keywords = set()
+    for field in ['Subject', 'Keywords']:
+        if field in metadata:
+            value = metadata[field]
+            if isinstance(value, list):
+                for item in value:
+                    keywords.add(str(item))
+            elif isinstance(value, str):
+                keywords.add(value)
+    return list(keywords)
+
+
+def get_xmp_keywords(file_path: Path, strip_prefixes: bool = STRIP_HIERARCHICAL_PREFIXES, debug: bool = False, session: ExifToolSession = None) -> list[str]:
+    """Extract XMP keywords from a file using exiftool."""
+    metadata = _read_keyword_metadata(file_path, session=session, debug=debug)
+    if not metadata:
+        if debug:
+            print(f"  → No data returned from exiftool")
         return []
+    return _keywords_from_metadata(metadata)
+
+
+# How many paths to hand one exiftool invocation in batch mode
+_BATCH_CHUNK_SIZE = 200
+
+
+def _read_keyword_metadata_batch(paths: list[Path]) -> dict[Path, dict]:
+    """Read keyword metadata for many files with one exiftool per chunk.
+
+    Perl startup amortizes across each chunk of paths (fed via an -@ stdin
+    argfile); results are keyed back to the inputs by SourceFile. Files
+    exiftool could not read are simply absent from the result.
+    """
+    results = {}
+    for start in range(0, len(paths), _BATCH_CHUNK_SIZE):
+        chunk = paths[start:start + _BATCH_CHUNK_SIZE]
+        try:
+            result = subprocess.run(
+                ['exiftool'] + _EXIFTOOL_ARGS + ['-@', '-'],
+                input='\n'.join(str(p) for p in chunk),
+                capture_output=True,
+                text=True,
+                check=False
+            )
+            data = json.loads(result.stdout) if result.stdout else []
+        except (OSError, json.JSONDecodeError):
+            continue
+        for entry in data:
+            source = entry.get('SourceFile')
+            if source:
+                results[Path(source)] = entry
+    return results
 
 
-def get_detailed_keywords(file_path: Path) -> dict:
+def get_xmp_keywords_batch(paths: list[Path]) -> dict[Path, list[str]]:
+    """Extract XMP keywords for many files in batched exiftool calls."""
+    return {
+        path: _keywords_from_metadata(metadata)
+        for path, metadata in _read_keyword_metadata_batch(paths).items()
+    }
+
+
+@functools.lru_cache(maxsize=65536)
+def _strip_one(keyword: str) -> str:
+    """Leaf of a hierarchical keyword ("Other Keywords|hero" -> "hero").
+
+    Memoized: libraries reuse a small tag vocabulary across thousands of
+    files, so most lookups hit the cache instead of re-splitting.
+    """
+    return keyword.rsplit('|', 1)[-1]
+
+
+def _strip_hierarchy(keywords: list[str]) -> list[str]:
+    """Reduce hierarchical keywords to their leaves, duplicates removed
+    in case two hierarchies share a leaf. Pure string work — no exiftool
+    round-trip.
+    """
+    return list(dict.fromkeys(_strip_one(k) for k in keywords))
+
+
+def get_detailed_keywords(file_path: Path, session: ExifToolSession = None) -> dict:
     """Get detailed keyword information from a file including all metadata fields."""
-    try:
-        result = subprocess.run(
-            ['exiftool', '-json', '-Subject', '-Keywords', '-HierarchicalSubject', str(file_path)],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        data = json.loads(result.stdout)
-        if not data:
-            return {}
-        
-        metadata = data[0]
-        return {
-            'Keywords': metadata.get('Keywords', []),
-            'Subject': metadata.get('Subject', []),
-            'HierarchicalSubject': metadata.get('HierarchicalSubject', [])
-        }
-    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError):
+    metadata = _read_keyword_metadata(file_path, session=session)
+    if not metadata:
         return {}
+    return {
+        'Keywords': metadata.get('Keywords', []),
+        'Subject': metadata.get('Subject', []),
+        'HierarchicalSubject': metadata.get('HierarchicalSubject', [])
+    }
 
 
-def display_keywords(file_path: Path):
+def display_keywords(file_path: Path, session: ExifToolSession = None, details: dict = None):
     """Display detailed keyword information for a file."""
-    keywords = get_detailed_keywords(file_path)
+    keywords = details if details is not None else get_detailed_keywords(file_path, session=session)
     
     if not any(keywords.values()):
         print(f"  No keywords found")
@@ -167,31 +317,170 @@ def display_keywords(file_path: Path):
                 print(f"  {field:25s}: {values}")
 
 
+def _iter_supported(root):
+    """Yield supported files under root, depth-first.
+
+    os.scandir's DirEntry carries the name and file/dir type from the
+    directory read itself, so the suffix filter runs on the raw string and
+    no stat or Path object is spent on entries we will never touch.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_supported(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                dot = entry.name.rfind('.')
+                if dot != -1 and entry.name[dot:].lower() in SUPPORTED_EXTENSIONS:
+                    yield Path(entry.path)
+
+
 def check_keywords_folder(folder_path: Path):
     """Display keywords for all supported files in a folder."""
-    file_count = 0
-    
-    for root, _, files in os.walk(folder_path):
-        for filename in files:
-            file_path = Path(root) / filename
-            
-            # Skip unsupported file types
-            if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
-                continue
-            
-            # Skip XMP sidecar files
-            if file_path.suffix.lower() == '.xmp':
-                continue
-            
-            file_count += 1
-            print(f"\n{file_path}")
-            display_keywords(file_path)
-    
-    return file_count
+    # Skip XMP sidecar files
+    file_paths = [p for p in _iter_supported(folder_path)
+                  if p.suffix.lower() != '.xmp']
+
+    # One exiftool per chunk of files instead of one per file
+    batch = _read_keyword_metadata_batch(file_paths)
+    for file_path in file_paths:
+        print(f"\n{file_path}")
+        metadata = batch.get(file_path, {})
+        display_keywords(file_path, details={
+            'Keywords': metadata.get('Keywords', []),
+            'Subject': metadata.get('Subject', []),
+            'HierarchicalSubject': metadata.get('HierarchicalSubject', [])
+        })
+
+    return len(file_paths)
+
+
+# Native xattr access: one syscall per tag read/write instead of a
+# fork+exec of /usr/bin/xattr. os.getxattr exists on Linux; macOS needs a
+# ctypes binding to libc (its signatures carry position/options args).
+# When neither is available the subprocess path below still works.
+_XATTR_TAGS = b'com.apple.metadata:_kMDItemUserTags'
+
+_xattr_get = None
+_xattr_set = None
+_xattr_remove = None
+
+if hasattr(os, 'getxattr'):
+    def _xattr_get(file_path: Path):
+        """Read the Finder-tags xattr; None when absent or unreadable."""
+        try:
+            return os.getxattr(str(file_path), _XATTR_TAGS)
+        except OSError:
+            return None
+
+    def _xattr_set(file_path: Path, data: bytes) -> bool:
+        """Write the Finder-tags xattr."""
+        try:
+            os.setxattr(str(file_path), _XATTR_TAGS, data)
+            return True
+        except OSError:
+            return False
+
+    def _xattr_remove(file_path: Path) -> bool:
+        """Remove the Finder-tags xattr (absence is not an error)."""
+        try:
+            os.removexattr(str(file_path), _XATTR_TAGS)
+        except OSError:
+            pass
+        return True
+
+elif sys.platform == 'darwin':
+    import ctypes
+
+    try:
+        _libc = ctypes.CDLL('libc.dylib', use_errno=True)
+        _libc.getxattr.restype = ctypes.c_ssize_t
+        _libc.getxattr.argtypes = [ctypes.c_char_p, ctypes.c_char_p,
+                                   ctypes.c_void_p, ctypes.c_size_t,
+                                   ctypes.c_uint32, ctypes.c_int]
+        _libc.setxattr.restype = ctypes.c_int
+        _libc.setxattr.argtypes = [ctypes.c_char_p, ctypes.c_char_p,
+                                   ctypes.c_void_p, ctypes.c_size_t,
+                                   ctypes.c_uint32, ctypes.c_int]
+        _libc.removexattr.restype = ctypes.c_int
+        _libc.removexattr.argtypes = [ctypes.c_char_p, ctypes.c_char_p,
+                                      ctypes.c_int]
+    except (OSError, AttributeError):
+        _libc = None
+
+    if _libc is not None:
+        def _xattr_get(file_path: Path):
+            """Read the Finder-tags xattr; None when absent or unreadable."""
+            path = os.fsencode(str(file_path))
+            size = _libc.getxattr(path, _XATTR_TAGS, None, 0, 0, 0)
+            if size < 0:
+                return None
+            buf = ctypes.create_string_buffer(size)
+            size = _libc.getxattr(path, _XATTR_TAGS, buf, size, 0, 0)
+            if size < 0:
+                return None
+            return buf.raw[:size]
+
+        def _xattr_set(file_path: Path, data: bytes) -> bool:
+            """Write the Finder-tags xattr."""
+            path = os.fsencode(str(file_path))
+            return _libc.setxattr(path, _XATTR_TAGS, data, len(data), 0, 0) == 0
+
+        def _xattr_remove(file_path: Path) -> bool:
+            """Remove the Finder-tags xattr (absence is not an error)."""
+            path = os.fsencode(str(file_path))
+            _libc.removexattr(path, _XATTR_TAGS, 0)
+            return True
+
+
+# Per-process cache of Finder tags keyed by (path, mtime_ns): merge mode
+# reads tags right back for files whose tags were just written
+_FINDER_TAG_CACHE = OrderedDict()
+_FINDER_TAG_CACHE_MAX = 4096
+
+
+def _finder_tag_cache_key(file_path: Path):
+    """Cache key for a file's tags, or None when the file can't be stat'd."""
+    try:
+        return (str(file_path), os.stat(file_path).st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _finder_tag_cache_store(key, tags: list[str]):
+    """Remember a file's tags, evicting the oldest entries past the cap."""
+    _FINDER_TAG_CACHE[key] = list(tags)
+    _FINDER_TAG_CACHE.move_to_end(key)
+    while len(_FINDER_TAG_CACHE) > _FINDER_TAG_CACHE_MAX:
+        _FINDER_TAG_CACHE.popitem(last=False)
 
 
 def get_finder_tags(file_path: Path) -> list[str]:
     """Get existing Finder tags for a file."""
+    key = _finder_tag_cache_key(file_path)
+    if key is not None and key in _FINDER_TAG_CACHE:
+        _FINDER_TAG_CACHE.move_to_end(key)
+        return list(_FINDER_TAG_CACHE[key])
+    tags = _read_finder_tags(file_path)
+    if key is not None:
+        _finder_tag_cache_store(key, tags)
+    return tags
+
+
+def _read_finder_tags(file_path: Path) -> list[str]:
+    """Read Finder tags from the filesystem (uncached)."""
+    if _xattr_get is not None:
+        data = _xattr_get(file_path)
+        if data is None:
+            return []
+        try:
+            # Tags are stored as "TagName\n0" or similar format
+            return [tag.split('\n')[0] for tag in plistlib.loads(data)]
+        except plistlib.InvalidFileException:
+            return []
     try:
         result = subprocess.run(
             ['xattr', '-p', 'com.apple.metadata:_kMDItemUserTags', str(file_path)],
@@ -206,8 +495,54 @@ def get_finder_tags(file_path: Path) -> list[str]:
         return []
 
 
+# Inodes whose tags we just wrote, so the watcher can ignore the
+# AttributeModified events raised by our own writes
+_JUST_WROTE = {}
+_WRITE_ECHO_WINDOW = 2.0  # seconds; covers FSEvents' coalescing latency
+
+
 def set_finder_tags(file_path: Path, tags: list[str]) -> bool:
     """Set or clear Finder tags for a file."""
+    # Don't rewrite an xattr that already matches: re-runs and watcher
+    # re-fires hit this constantly, and the write itself generates another
+    # filesystem event for the watcher to chew on
+    if set(get_finder_tags(file_path)) == set(tags):
+        return True
+    success = _write_finder_tags(file_path, tags)
+    if success:
+        key = _finder_tag_cache_key(file_path)
+        if key is not None:
+            _finder_tag_cache_store(key, tags)
+        try:
+            st = os.stat(file_path)
+            now = time.monotonic()
+            # Sweep expired entries on insert so the map only ever holds
+            # inodes written within the echo window
+            for key in [k for k, v in _JUST_WROTE.items() if now - v >= _WRITE_ECHO_WINDOW]:
+                del _JUST_WROTE[key]
+            _JUST_WROTE[(st.st_dev, st.st_ino)] = now
+        except OSError:
+            pass
+    return success
+
+
+def _tags_plist(tags: list[str]) -> bytes:
+    """Serialize tags into Finder's binary-plist payload.
+
+    Tags are stored as "TagName\\n0" entries; plain concatenation skips the
+    f-string machinery and sort_keys is disabled to keep the given order.
+    """
+    return plistlib.dumps([tag + "\n0" for tag in tags],
+                          fmt=plistlib.FMT_BINARY, sort_keys=False)
+
+
+def _write_finder_tags(file_path: Path, tags: list[str]) -> bool:
+    """Write Finder tags to the filesystem (uncached)."""
+    if _xattr_set is not None:
+        if not tags:
+            return _xattr_remove(file_path)
+        # Native setxattr takes the plist bytes directly — no hex round-trip
+        return _xattr_set(file_path, _tags_plist(tags))
     try:
         if not tags:
             # Clear tags by removing the xattr
@@ -217,35 +552,36 @@ def set_finder_tags(file_path: Path, tags: list[str]) -> bool:
                 check=False
             )
             return True
-        
-        formatted_tags = [f"{tag}\n0" for tag in tags]
-        plist_data = plistlib.dumps(formatted_tags, fmt=plistlib.FMT_BINARY)
-        
-        # Write to temp file and use xattr to read from it
-        import tempfile
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            tmp.write(plist_data)
-            tmp_path = tmp.name
-        
+
+        plist_data = _tags_plist(tags)
+
+        # xattr -wx takes the payload as hex on the command line
         subprocess.run(
             ['xattr', '-wx', 'com.apple.metadata:_kMDItemUserTags', plist_data.hex(), str(file_path)],
             check=True
         )
-        os.unlink(tmp_path)
         return True
     except subprocess.CalledProcessError:
         return False
 
 
-def process_file(file_path: Path, dry_run: bool = False, merge: bool = True, strip_prefixes: bool = STRIP_HIERARCHICAL_PREFIXES, debug: bool = False) -> tuple[bool, list[str]]:
+def process_file(file_path: Path, dry_run: bool = False, merge: bool = True, strip_prefixes: bool = STRIP_HIERARCHICAL_PREFIXES, debug: bool = False, session: ExifToolSession = None) -> tuple[bool, list[str]]:
     """
     Process a single file: extract XMP keywords and set as Finder tags.
-    
+
     Returns: (success, keywords_found)
     """
     # Get raw keywords first to check for marker (if needed)
-    raw_keywords = get_xmp_keywords(file_path, strip_prefixes=False, debug=debug)
-    
+    metadata = _read_keyword_metadata(file_path, session=session, debug=debug)
+    if not metadata:
+        # An empty dict means the read failed (a successful exiftool read
+        # always carries at least SourceFile); report an error so the run
+        # doesn't record this file as processed
+        if debug:
+            print(f"  → exiftool read failed")
+        return False, []
+    raw_keywords = _keywords_from_metadata(metadata)
+
     if not raw_keywords:
         if debug:
             print(f"  → No keywords found in file")
@@ -261,15 +597,12 @@ def process_file(file_path: Path, dry_run: bool = False, merge: bool = True, str
                 print(f"  → Marker keyword '{MARKER_KEYWORD}' not found, skipping file")
             return True, []
     
-    # Apply prefix stripping if needed
-    if strip_prefixes != STRIP_HIERARCHICAL_PREFIXES:
-        keywords = get_xmp_keywords(file_path, strip_prefixes=strip_prefixes, debug=debug)
-    else:
-        keywords = raw_keywords
+    # Apply prefix stripping in Python — no second exiftool read
+    keywords = _strip_hierarchy(raw_keywords) if strip_prefixes else raw_keywords
     
     # Remove marker keyword from the tags to be set
     if MARKER_KEYWORD:
-        keywords = [k for k in keywords if k.lower() != MARKER_KEYWORD.lower()]
+        keywords = [k for k in keywords if k.lower() != _MARKER_LOWER]
         if not keywords and merge:
             # In merge mode, skip files with only marker keyword
             if debug:
@@ -279,7 +612,11 @@ def process_file(file_path: Path, dry_run: bool = False, merge: bool = True, str
     
     if merge:
         existing_tags = get_finder_tags(file_path)
-        all_tags = list(set(existing_tags + keywords))
+        if set(existing_tags).issuperset(keywords):
+            # Every keyword is already a tag — nothing to write
+            return True, keywords
+        # Preserve the existing tag order and append the new keywords
+        all_tags = list(dict.fromkeys(existing_tags + keywords))
     else:
         all_tags = keywords
     
@@ -290,26 +627,33 @@ def process_file(file_path: Path, dry_run: bool = False, merge: bool = True, str
     return success, keywords
 
 
-def process_xmp_sidecar(sidecar_path: Path, dry_run: bool = False, merge: bool = True, verbose: bool = False, strip_prefixes: bool = STRIP_HIERARCHICAL_PREFIXES) -> tuple[bool, int]:
+def process_xmp_sidecar(sidecar_path: Path, dry_run: bool = False, merge: bool = True, verbose: bool = False, strip_prefixes: bool = STRIP_HIERARCHICAL_PREFIXES, session: ExifToolSession = None) -> tuple[bool, int]:
     """Process an XMP sidecar file and apply keywords to the main file.
-    
+
     Returns: (success, tagged_count)
     """
     main_file = sidecar_path.with_suffix('')
     if not main_file.exists():
         return False, 0
-    
-    keywords = get_xmp_keywords(sidecar_path, strip_prefixes=strip_prefixes)
-    if not keywords:
+
+    # One exiftool read: the marker check uses the raw keywords and any
+    # prefix stripping happens in Python afterwards
+    metadata = _read_keyword_metadata(sidecar_path, session=session)
+    if not metadata:
+        # Failed read (see process_file) — don't report this sidecar done
+        return False, 0
+    raw_keywords = _keywords_from_metadata(metadata)
+    if not raw_keywords:
         return True, 0
-    
+
+    keywords = _strip_hierarchy(raw_keywords) if strip_prefixes else raw_keywords
+
     # Check for marker keyword if configured
     if MARKER_KEYWORD:
-        raw_keywords = get_xmp_keywords(sidecar_path, strip_prefixes=False)
         if MARKER_KEYWORD not in raw_keywords:
             return True, 0
         # Remove marker keyword from tags
-        keywords = [k for k in keywords if k.lower() != MARKER_KEYWORD.lower()]
+        keywords = [k for k in keywords if k.lower() != _MARKER_LOWER]
         if not keywords:
             return True, 0
     
@@ -318,7 +662,10 @@ def process_xmp_sidecar(sidecar_path: Path, dry_run: bool = False, merge: bool =
     
     if merge:
         existing = get_finder_tags(main_file)
-        keywords = list(set(existing + keywords))
+        if set(existing).issuperset(keywords):
+            # Main file already carries every keyword — skip the write
+            return True, 1
+        keywords = list(dict.fromkeys(existing + keywords))
     
     success = set_finder_tags(main_file, keywords)
     if verbose and success:
@@ -327,38 +674,178 @@ def process_xmp_sidecar(sidecar_path: Path, dry_run: bool = False, merge: bool =
     return success, 1 if success else 0
 
 
-def process_folder(folder_path: Path, dry_run: bool = False, merge: bool = True, verbose: bool = False, strip_prefixes: bool = STRIP_HIERARCHICAL_PREFIXES):
-    """Recursively process all supported files in a folder."""
+# On-disk record of files already processed, keyed by path with their
+# (mtime, size) at the time: unchanged files are skipped on later runs
+KEYWORD_CACHE_PATH = Path.home() / ".cache" / "bridge-keywords" / "processed.json"
+
+
+def _load_keyword_cache() -> dict:
+    """Load the processed-file cache; an empty dict when missing or bad."""
+    try:
+        with open(KEYWORD_CACHE_PATH) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except (OSError, json.JSONDecodeError):
+        pass
+    return {}
+
+
+def _save_keyword_cache(cache: dict):
+    """Atomically persist the processed-file cache; best-effort."""
+    try:
+        KEYWORD_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = KEYWORD_CACHE_PATH.with_suffix('.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp, KEYWORD_CACHE_PATH)
+    except OSError:
+        pass  # The cache is an optimization; losing it only costs speed
+
+
+def _cache_fresh(cache: dict, file_path: Path) -> bool:
+    """True when a file is unchanged since its cached processing."""
+    entry = cache.get(str(file_path))
+    if not entry:
+        return False
+    try:
+        st = file_path.stat()
+    except OSError:
+        cache.pop(str(file_path), None)
+        return False
+    return entry[0] == st.st_mtime and entry[1] == st.st_size
+
+
+def _cache_record(cache: dict, file_path: Path):
+    """Record a file's current (mtime, size) after successful processing."""
+    try:
+        st = file_path.stat()
+        cache[str(file_path)] = [st.st_mtime, st.st_size]
+    except OSError:
+        cache.pop(str(file_path), None)
+
+
+# Each pool worker owns one resident exiftool process, created by the
+# pool initializer and torn down with the worker
+_WORKER_SESSION = None
+
+
+def _init_worker():
+    """Give a pool worker its own ExifToolSession."""
+    global _WORKER_SESSION
+    _WORKER_SESSION = ExifToolSession()
+
+
+def _process_one(file_path: Path, dry_run: bool, merge: bool, verbose: bool, strip_prefixes: bool):
+    """Process a single candidate file inside a pool worker.
+
+    Returns ('sidecar', success, tagged_count, path) or
+    ('file', success, keywords, path) for aggregation in the parent.
+    """
+    if file_path.suffix.lower() == '.xmp':
+        success, count = process_xmp_sidecar(file_path, dry_run, merge, verbose, strip_prefixes, session=_WORKER_SESSION)
+        return ('sidecar', success, count, file_path)
+    success, keywords = process_file(file_path, dry_run, merge, strip_prefixes=strip_prefixes, session=_WORKER_SESSION)
+    return ('file', success, keywords, file_path)
+
+
+def process_folder(folder_path: Path, dry_run: bool = False, merge: bool = True, verbose: bool = False, strip_prefixes: bool = STRIP_HIERARCHICAL_PREFIXES, jobs: int = None, force: bool = False):
+    """Recursively process all supported files in a folder.
+
+    Files are independent of each other, so the work is spread over a
+    process pool with one exiftool session per worker. jobs=1 runs
+    everything serially in this process, which is handy for debugging.
+    """
+    candidates = list(_iter_supported(folder_path))
+
+    # Skip files whose (mtime, size) still match the last successful run.
+    # Dry runs bypass the cache so they always report the full picture;
+    # --force keeps recording results but reprocesses everything.
+    cache = None
+    if not dry_run:
+        cache = _load_keyword_cache()
+        if not force:
+            candidates = [p for p in candidates if not _cache_fresh(cache, p)]
+
     processed = 0
     tagged = 0
     errors = 0
-    
-    for root, _, files in os.walk(folder_path):
-        for filename in files:
-            file_path = Path(root) / filename
-            
-            # Skip unsupported file types
-            if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
-                continue
-            
-            # Process XMP sidecar files separately
-            if file_path.suffix.lower() == '.xmp':
-                success, count = process_xmp_sidecar(file_path, dry_run, merge, verbose, strip_prefixes)
-                tagged += count
+
+    if not candidates:
+        return processed, tagged, errors
+
+    # Verbose output is buffered and written in batches so a large run
+    # isn't serialized behind one flushing print() per file
+    out_buf = []
+
+    def flush_output():
+        if out_buf:
+            sys.stdout.write(''.join(out_buf))
+            out_buf.clear()
+
+    # Non-verbose interactive runs get a rate-limited one-line progress
+    # counter; at most one rewrite per half second regardless of file count
+    total = len(candidates)
+    show_progress = not verbose and sys.stdout.isatty()
+    done = 0
+    last_progress = 0.0
+
+    def consume(results):
+        nonlocal processed, tagged, errors, done, last_progress
+        for kind, success, payload, file_path in results:
+            done += 1
+            if show_progress:
+                now = time.monotonic()
+                if now - last_progress >= 0.5:
+                    sys.stdout.write(f"\r  {done}/{total} files")
+                    sys.stdout.flush()
+                    last_progress = now
+            if success and cache is not None:
+                _cache_record(cache, file_path)
+
+            if kind == 'sidecar':
+                tagged += payload
+                if not success:
+                    errors += 1
+                    if verbose:
+                        out_buf.append(f"  ERROR: {file_path}\n")
                 continue
-            
+
             processed += 1
-            success, keywords = process_file(file_path, dry_run, merge, strip_prefixes=strip_prefixes)
-            
             if not success:
                 errors += 1
                 if verbose:
-                    print(f"  ERROR: {file_path}")
-            elif keywords:
+                    out_buf.append(f"  ERROR: {file_path}\n")
+            elif payload:
                 tagged += 1
                 if verbose:
-                    print(f"  {file_path.name}: {keywords}")
-    
+                    out_buf.append(f"  {file_path.name}: {payload}\n")
+            if len(out_buf) >= 1000:
+                flush_output()
+
+    worker = functools.partial(_process_one, dry_run=dry_run, merge=merge,
+                               verbose=verbose, strip_prefixes=strip_prefixes)
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1:
+        global _WORKER_SESSION
+        with ExifToolSession() as session:
+            _WORKER_SESSION = session
+            try:
+                consume(map(worker, candidates))
+            finally:
+                _WORKER_SESSION = None
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            consume(pool.map(worker, candidates))
+    flush_output()
+    if last_progress:
+        sys.stdout.write('\r' + ' ' * len(f"  {total}/{total} files") + '\r')
+        sys.stdout.flush()
+
+    if cache is not None:
+        _save_keyword_cache(cache)
+
     return processed, tagged, errors
 
 
@@ -367,10 +854,70 @@ def get_launchd_plist_path() -> Path:
     return Path.home() / "Library" / "LaunchAgents" / "com.user.bridge-keywords-watcher.plist"
 
 
+def get_pid_file_path() -> Path:
+    """Get the path to the watcher's PID file.
+
+    The menu bar app uses this for a cheap liveness probe (os.kill(pid, 0))
+    instead of shelling out to launchctl.
+    """
+    return Path.home() / "Library" / "Application Support" / "bridge-keywords" / "pid"
+
+
+def write_pid_file():
+    """Record the current PID so other tools can check the watcher cheaply."""
+    pid_file = get_pid_file_path()
+    try:
+        pid_file.parent.mkdir(parents=True, exist_ok=True)
+        pid_file.write_text(str(os.getpid()))
+        # Clean up on any interpreter exit (Ctrl-C, stream EOF, ...) so
+        # foreground --watch runs don't leave a stale PID behind
+        atexit.register(remove_pid_file)
+    except OSError:
+        pass  # Purely an optimization; the watcher works without it
+
+
+def remove_pid_file():
+    """Drop the PID file so a recycled PID can't look like a live watcher."""
+    try:
+        get_pid_file_path().unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+# Optional JSON sidecar holding the watch directories. When present it takes
+# precedence over WATCH_DIRECTORIES above; the dashboard edits this file so
+# adding/removing a directory no longer rewrites this script.
+CONFIG_PATH = Path.home() / ".config" / "bridge-keywords" / "watch.json"
+
+# Parsed sidecar keyed by its mtime so repeated reads cost one os.stat
+_CONFIG_CACHE = {'mtime': 0.0, 'data': None}
+
+
+def load_watch_directories() -> list[str]:
+    """Return the configured watch directory strings.
+
+    Reads the JSON sidecar when it exists and is valid, falling back to the
+    in-script WATCH_DIRECTORIES list. The parsed list is cached against the
+    file's mtime, so callers can invoke this freely without re-parsing.
+    """
+    try:
+        mtime = os.stat(CONFIG_PATH).st_mtime
+        if mtime != _CONFIG_CACHE['mtime'] or _CONFIG_CACHE['data'] is None:
+            with open(CONFIG_PATH) as f:
+                data = json.load(f)
+            if not isinstance(data, list):
+                raise json.JSONDecodeError("expected a list", "", 0)
+            _CONFIG_CACHE['mtime'] = mtime
+            _CONFIG_CACHE['data'] = [str(p) for p in data]
+        return list(_CONFIG_CACHE['data'])
+    except (OSError, json.JSONDecodeError):
+        return WATCH_DIRECTORIES
+
+
 def get_configured_watch_paths() -> list[Path]:
     """Get the list of directories configured for watching."""
     paths = []
-    for path_str in WATCH_DIRECTORIES:
+    for path_str in load_watch_directories():
         if path_str and path_str.strip():
             path = Path(path_str).expanduser().resolve()
             if path.exists() and path.is_dir():
@@ -438,14 +985,16 @@ def create_launchd_plist(script_path: Path) -> bool:
 def service_status() -> str:
     """Check if the watcher service is running."""
     try:
+        # Asking launchctl for the label directly returns just that job's
+        # info (exit 0 when loaded) instead of a dump of every job to scan
         result = subprocess.run(
-            ['launchctl', 'list'],
+            ['launchctl', 'list', 'com.user.bridge-keywords-watcher'],
             capture_output=True,
             text=True,
             check=False,
             timeout=2
         )
-        if 'com.user.bridge-keywords-watcher' in result.stdout:
+        if result.returncode == 0:
             return 'running'
         else:
             plist_path = get_launchd_plist_path()
@@ -457,6 +1006,31 @@ def service_status() -> str:
         return 'unknown'
 
 
+def print_service_status():
+    """Print the watcher service status and watch configuration."""
+    status = service_status()
+    plist_path = get_launchd_plist_path()
+    watch_paths = get_configured_watch_paths()
+
+    print(f"Service status: {status}")
+    if status != 'not-installed':
+        print(f"Config file: {plist_path}")
+        if status == 'running':
+            print(f"Log file: {Path.home()}/Library/Logs/bridge-keywords-watcher.log")
+
+    if watch_paths:
+        print(f"\nConfigured to watch {len(watch_paths)} director{'y' if len(watch_paths) == 1 else 'ies'}:")
+        for path in watch_paths:
+            print(f"  - {path}")
+    else:
+        print("\nNo directories configured in WATCH_DIRECTORIES")
+
+    if status == 'not-installed':
+        print("\nInstall the service with: python3 bridge_keywords_to_tags.py service-install")
+    elif status == 'stopped':
+        print("\nStart the service with: python3 bridge_keywords_to_tags.py service-start")
+
+
 def service_install(script_path: Path, autostart: bool = False) -> bool:
     """Install the watcher service."""
     plist_path = get_launchd_plist_path()
@@ -518,6 +1092,7 @@ def service_uninstall() -> bool:
     # Remove the plist file
     try:
         plist_path.unlink()
+        remove_pid_file()
         print("✓ Service uninstalled successfully")
         return True
     except OSError as e:
@@ -564,6 +1139,7 @@ def service_stop() -> bool:
     
     try:
         subprocess.run(['launchctl', 'unload', str(plist_path)], check=True)
+        remove_pid_file()
         print("✓ Service stopped successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -591,6 +1167,38 @@ def service_restart() -> bool:
     return result
 
 
+def _follow_log(log_path: Path):
+    """Stream lines appended to a log file, in-process.
+
+    Seeks to the end of the file and then reads whatever gets appended,
+    waking on kqueue vnode events where available (macOS) and falling
+    back to a short poll elsewhere.
+    """
+    fd = os.open(str(log_path), os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        os.lseek(fd, 0, os.SEEK_END)
+        kq = None
+        if hasattr(select, 'kqueue'):
+            kq = select.kqueue()
+            kq.control([select.kevent(
+                fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND,
+            )], 0)
+        while True:
+            chunk = os.read(fd, 65536)
+            if chunk:
+                sys.stdout.write(chunk.decode('utf-8', errors='replace'))
+                sys.stdout.flush()
+            elif kq is not None:
+                kq.control(None, 1, 2.0)
+            else:
+                time.sleep(0.5)
+    finally:
+        os.close(fd)
+
+
 def service_logs(follow: bool = False):
     """Display service logs."""
     log_path = Path.home() / "Library" / "Logs" / "bridge-keywords-watcher.log"
@@ -601,9 +1209,14 @@ def service_logs(follow: bool = False):
         return
     
     if follow:
+        # The guard above passes when either log exists; following needs
+        # the output log specifically
+        if not log_path.exists():
+            print(f"No output log to follow at {log_path}")
+            return
         print("Following logs (press Ctrl+C to stop)...\n")
         try:
-            subprocess.run(['tail', '-f', str(log_path)], check=False)
+            _follow_log(log_path)
         except KeyboardInterrupt:
             print("\nStopped following logs.")
     else:
@@ -622,8 +1235,130 @@ def service_logs(follow: bool = False):
                     print("(empty)")
 
 
+def _start_service_logging() -> logging.Logger:
+    """Set up queue-backed logging for service mode.
+
+    The watcher's event loop hands log records to an in-memory queue and a
+    QueueListener thread does the actual stdout writes (launchd redirects
+    stdout to the watcher log file), so filesystem events are never stalled
+    behind disk I/O.
+    """
+    log_queue = queue.Queue(-1)
+    logger = logging.getLogger("bridge.watcher")
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return logger
+
+
+# Sentinel queued when an event stream ends so the watch loop can exit
+_STREAM_EOF = object()
+
+
+def _start_fsevents_stream(watch_paths: list[Path], event_queue):
+    """Deliver changed paths through FSEvents (pyobjc) into event_queue.
+
+    Returns the runloop thread, or None when pyobjc's FSEvents bindings
+    aren't installed or the stream fails to start — the caller then falls
+    back to fswatch. Native
+    FSEvents skips the subprocess and stdout line parsing entirely and
+    coalesces bursts in the kernel before we ever see them.
+    """
+    try:
+        import FSEvents
+    except ImportError:
+        return None
+
+    def callback(stream_ref, client_info, num_events, event_paths, event_flags, event_ids):
+        for event_path in event_paths:
+            # fsdecode: without UseCFTypes the binding hands back bytes
+            event_queue.put(os.fsdecode(event_path))
+
+    started = threading.Event()
+    running = []
+
+    def run():
+        # UseCFTypes so the callback receives str paths, not char* bytes
+        stream = FSEvents.FSEventStreamCreate(
+            None, callback, None,
+            [str(p) for p in watch_paths],
+            FSEvents.kFSEventStreamEventIdSinceNow,
+            1.0,  # latency: let the kernel coalesce bursts for a second
+            FSEvents.kFSEventStreamCreateFlagFileEvents
+            | FSEvents.kFSEventStreamCreateFlagUseCFTypes
+        )
+        if stream is None:
+            started.set()
+            return
+        FSEvents.FSEventStreamScheduleWithRunLoop(
+            stream, FSEvents.CFRunLoopGetCurrent(), FSEvents.kCFRunLoopDefaultMode)
+        if not FSEvents.FSEventStreamStart(stream):
+            started.set()
+            return
+        running.append(True)
+        started.set()
+        FSEvents.CFRunLoopRun()
+        # The runloop only returns if the stream died mid-run; let the
+        # watcher exit so launchd restarts it rather than idling eventless
+        event_queue.put(_STREAM_EOF)
+
+    thread = threading.Thread(target=run, daemon=True, name='fsevents')
+    thread.start()
+    started.wait(timeout=5)
+    if not running:
+        return None
+    return thread
+
+
+def _start_fswatch_stream(watch_paths: list[Path], event_queue, emit):
+    """Deliver changed paths from an fswatch subprocess into event_queue.
+
+    Fallback for when the FSEvents bindings are unavailable. Returns the
+    fswatch process; exits when fswatch isn't installed.
+    """
+    fswatch_path = None
+    for path in ['/opt/homebrew/bin/fswatch', '/usr/local/bin/fswatch', '/usr/bin/fswatch']:
+        if Path(path).exists():
+            fswatch_path = path
+            break
+
+    if not fswatch_path:
+        emit("Error: fswatch is not installed.")
+        emit("Install it with: brew install fswatch")
+        sys.exit(1)
+
+    # Watch for Updated (content changes), Created (new files), and
+    # AttributeModified (XMP metadata changes)
+    fswatch_cmd = [fswatch_path, '-r', '--event', 'Updated', '--event', 'Created',
+                   '--event', 'AttributeModified'] + [str(p) for p in watch_paths]
+    process = subprocess.Popen(
+        fswatch_cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1  # Line buffered
+    )
+
+    def pump():
+        for line in process.stdout:
+            event_queue.put(line.strip())
+        event_queue.put(_STREAM_EOF)
+
+    threading.Thread(target=pump, daemon=True, name='fswatch-pump').start()
+    return process
+
+
 def watch_directories(watch_paths: list[Path], merge: bool = True, verbose: bool = False, from_service: bool = False, strip_prefixes: bool = STRIP_HIERARCHICAL_PREFIXES):
     """Watch directories for file changes and automatically sync keywords to tags."""
+    write_pid_file()
+    # In service mode, messages go through the background logging queue so
+    # the event loop never blocks on the log file
+    emit = _start_service_logging().info if from_service else print
     if not from_service:
         print("Starting file watcher...")
         print(f"Watching {len(watch_paths)} director{'y' if len(watch_paths) == 1 else 'ies'}:")
@@ -633,11 +1368,11 @@ def watch_directories(watch_paths: list[Path], merge: bool = True, verbose: bool
         print("\nPress Ctrl+C to stop\n")
     else:
         # Service mode - log startup and send notification
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Service started")
-        print(f"Watching {len(watch_paths)} director{'y' if len(watch_paths) == 1 else 'ies'}:")
+        emit(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Service started")
+        emit(f"Watching {len(watch_paths)} director{'y' if len(watch_paths) == 1 else 'ies'}:")
         for path in watch_paths:
-            print(f"  - {path}")
-        print(f"Strip hierarchical prefixes: {'enabled' if strip_prefixes else 'disabled'}")
+            emit(f"  - {path}")
+        emit(f"Strip hierarchical prefixes: {'enabled' if strip_prefixes else 'disabled'}")
         send_notification("Bridge Keywords Sync", "Service started", f"Watching {len(watch_paths)} folder(s)")
     
     # Track last modification times to avoid duplicate processing
@@ -654,58 +1389,36 @@ def watch_directories(watch_paths: list[Path], merge: bool = True, verbose: bool
     processing_start_time = None
     
     # Initial scan of all directories
-    print("Performing initial scan...")
+    emit("Performing initial scan...")
     for watch_path in watch_paths:
         if watch_path.is_dir():
             processed, tagged, errors = process_folder(watch_path, dry_run=False, merge=merge, verbose=verbose, strip_prefixes=strip_prefixes)
             if verbose:
-                print(f"Initial scan of {watch_path}: {tagged} files tagged")
-    
-    print("\nWatching for changes...\n")
-    
-    # Use fswatch to monitor directories
-    # fswatch is more reliable than Python's watchdog on macOS
-    # Check for fswatch in common locations
-    fswatch_path = None
-    for path in ['/opt/homebrew/bin/fswatch', '/usr/local/bin/fswatch', '/usr/bin/fswatch']:
-        if Path(path).exists():
-            fswatch_path = path
-            break
-    
-    if not fswatch_path:
-        print("Error: fswatch is not installed.")
-        print("Install it with: brew install fswatch")
-        sys.exit(1)
-    
-    # Build fswatch command
-    # Watch for Updated (content changes), Created (new files), and AttributeModified (XMP metadata changes)
-    fswatch_cmd = [fswatch_path, '-r', '--event', 'Updated', '--event', 'Created', '--event', 'AttributeModified'] + [str(p) for p in watch_paths]
+                emit(f"Initial scan of {watch_path}: {tagged} files tagged")
     
+    emit("\nWatching for changes...\n")
+
+    # Prefer native FSEvents (no subprocess, kernel-side coalescing);
+    # fall back to fswatch when the pyobjc bindings are missing
+    event_queue = queue.Queue()
+    process = None
+    if _start_fsevents_stream(watch_paths, event_queue) is None:
+        process = _start_fswatch_stream(watch_paths, event_queue, emit)
+
     try:
-        process = subprocess.Popen(
-            fswatch_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=0  # Unbuffered for immediate output
-        )
-        
-        # Process file changes as they're detected
-        # Use a non-blocking approach with select to batch events
-        import select
-        
         while True:
-            # Check if data is available (with 2 second timeout for batching)
-            ready, _, _ = select.select([process.stdout], [], [], 2)
-            
-            if ready:
-                # Read available line
-                line = process.stdout.readline()
-                if not line:
-                    break  # Process ended
-                    
-                changed_path = Path(line.strip())
-                
+            # Wait for the next event (with 2 second timeout for batching)
+            try:
+                event = event_queue.get(timeout=2)
+            except queue.Empty:
+                event = None
+
+            if event is not None:
+                if event is _STREAM_EOF:
+                    break  # Event source ended
+
+                changed_path = Path(event)
+
                 # Skip if not a supported file
                 if changed_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
                     continue
@@ -714,16 +1427,22 @@ def watch_directories(watch_paths: list[Path], merge: bool = True, verbose: bool
                 if not changed_path.exists():
                     continue
                 
-                # Check modification time to avoid duplicate processing
+                # Deduplicate by inode: atomic saves replace the file under
+                # the same path, so a Path-keyed mtime check misses them
                 try:
-                    mtime = changed_path.stat().st_mtime
-                    last_mtime = last_processed.get(changed_path, 0)
-                    
+                    st = changed_path.stat()
+                    inode = (st.st_dev, st.st_ino)
+
                     # Skip if same modification time (duplicate event)
-                    if last_mtime > 0 and mtime == last_mtime:
+                    if last_processed.get(inode) == st.st_mtime_ns:
+                        continue
+
+                    # Skip the event echo of our own xattr write
+                    wrote_at = _JUST_WROTE.get(inode)
+                    if wrote_at is not None and time.monotonic() - wrote_at < _WRITE_ECHO_WINDOW:
                         continue
-                    
-                    last_processed[changed_path] = mtime
+
+                    last_processed[inode] = st.st_mtime_ns
                 except OSError:
                     continue
                 
@@ -746,41 +1465,42 @@ def watch_directories(watch_paths: list[Path], merge: bool = True, verbose: bool
                         num_files = len(pending_files)
                         if from_service:
                             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            print(f"[{timestamp}] Processing {num_files} file(s)...")
+                            emit(f"[{timestamp}] Processing {num_files} file(s)...")
                         
-                        # Build command to process all files
-                        script_path = Path(__file__).resolve()
+                        # Process in-process: no python3 re-exec per file,
+                        # and the shared exiftool daemon serves every batch
                         files_to_process = list(pending_files)
                         batch_synced = 0
                         batch_errors = 0
-                        
+
+                        session = _exiftool_daemon()
                         for file_path in files_to_process:
                             try:
-                                # Build command with replace flag if needed
-                                cmd = ['python3', str(script_path), str(file_path), '-v']
-                                if not merge:  # merge=False means replace mode
-                                    cmd.append('-r')
-                                
-                                result = subprocess.run(
-                                    cmd,
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=30
-                                )
-                                
+                                if file_path.suffix.lower() == '.xmp':
+                                    success, count = process_xmp_sidecar(
+                                        file_path, merge=merge,
+                                        strip_prefixes=strip_prefixes, session=session)
+                                    synced = count > 0
+                                else:
+                                    success, keywords = process_file(
+                                        file_path, merge=merge,
+                                        strip_prefixes=strip_prefixes, session=session)
+                                    synced = bool(keywords)
+
                                 if from_service:
-                                    if result.returncode == 0 and 'Files with keywords: 1' in result.stdout:
-                                        print(f"  ✓ Synced: {file_path.name}")
+                                    if success and synced:
+                                        emit(f"  ✓ Synced: {file_path.name}")
                                         batch_synced += 1
-                                    elif result.returncode == 0 and 'Files with keywords: 0' in result.stdout:
-                                        # File processed but no keywords (tags cleared in replace mode)
+                                    elif success:
+                                        # Processed but nothing to sync (no
+                                        # keywords, or tags cleared in replace mode)
                                         batch_synced += 1
-                                    elif result.returncode != 0:
-                                        print(f"  ✗ ERROR: {file_path.name}")
+                                    else:
+                                        emit(f"  ✗ ERROR: {file_path.name}")
                                         batch_errors += 1
                             except Exception as e:
                                 if from_service:
-                                    print(f"  ✗ {file_path.name}: {str(e)[:100]}")
+                                    emit(f"  ✗ {file_path.name}: {str(e)[:100]}")
                                     batch_errors += 1
                         
                         # Update session totals
@@ -806,10 +1526,11 @@ def watch_directories(watch_paths: list[Path], merge: bool = True, verbose: bool
                             session_error_count = 0
     
     except KeyboardInterrupt:
-        print("\n\nStopping file watcher...")
-        process.terminate()
-        process.wait()
-        print("Watcher stopped.")
+        emit("\n\nStopping file watcher...")
+        if process is not None:
+            process.terminate()
+            process.wait()
+        emit("Watcher stopped.")
         sys.exit(0)
 
 
@@ -839,6 +1560,17 @@ def main():
         action='store_true',
         help='Show detailed output for each file'
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Number of worker processes for folder runs (default: CPU count; 1 runs serially)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reprocess files even if unchanged since the last successful run'
+    )
     parser.add_argument(
         '-c', '--check',
         action='store_true',
@@ -881,59 +1613,20 @@ def main():
         watch_directories(watch_paths, merge=not WATCH_REPLACE_MODE, verbose=False, from_service=True)
         sys.exit(0)
     
-    # Handle service commands
-    if args.path in ['service-install', 'service-uninstall', 'service-start', 
-                     'service-stop', 'service-restart', 'service-status', 'service-logs']:
-        command = args.path
-        
-        if command == 'service-status':
-            status = service_status()
-            plist_path = get_launchd_plist_path()
-            watch_paths = get_configured_watch_paths()
-            
-            print(f"Service status: {status}")
-            if status != 'not-installed':
-                print(f"Config file: {plist_path}")
-                if status == 'running':
-                    print(f"Log file: {Path.home()}/Library/Logs/bridge-keywords-watcher.log")
-            
-            if watch_paths:
-                print(f"\nConfigured to watch {len(watch_paths)} director{'y' if len(watch_paths) == 1 else 'ies'}:")
-                for path in watch_paths:
-                    print(f"  - {path}")
-            else:
-                print("\nNo directories configured in WATCH_DIRECTORIES")
-            
-            if status == 'not-installed':
-                print("\nInstall the service with: python3 bridge_keywords_to_tags.py service-install")
-            elif status == 'stopped':
-                print("\nStart the service with: python3 bridge_keywords_to_tags.py service-start")
-            sys.exit(0)
-            
-        elif command == 'service-install':
-            script_path = Path(__file__)
-            service_install(script_path, autostart=args.autostart)
-            sys.exit(0)
-            
-        elif command == 'service-uninstall':
-            service_uninstall()
-            sys.exit(0)
-            
-        elif command == 'service-start':
-            service_start()
-            sys.exit(0)
-            
-        elif command == 'service-stop':
-            service_stop()
-            sys.exit(0)
-            
-        elif command == 'service-restart':
-            service_restart()
-            sys.exit(0)
-            
-        elif command == 'service-logs':
-            service_logs(follow=args.follow)
-            sys.exit(0)
+    # Handle service commands via a dispatch table
+    service_commands = {
+        'service-install': lambda: service_install(Path(__file__), autostart=args.autostart),
+        'service-uninstall': service_uninstall,
+        'service-start': service_start,
+        'service-stop': service_stop,
+        'service-restart': service_restart,
+        'service-status': print_service_status,
+        'service-logs': lambda: service_logs(follow=args.follow),
+    }
+    handler = service_commands.get(args.path)
+    if handler is not None:
+        handler()
+        sys.exit(0)
     
     # Validate that path is provided for non-service commands
     if not args.path:
@@ -948,11 +1641,19 @@ def main():
         print("  service-logs [--follow]                  - View service logs")
         sys.exit(1)
     
-    path = Path(args.path).expanduser().resolve()
-    
-    if not path.exists():
-        print(f"Error: Path '{path}' does not exist")
+    # Resolve once at the os.path level; Path objects are only built for
+    # display and for handing to the processing functions
+    path_str = os.path.realpath(os.path.expanduser(args.path))
+
+    # One stat answers both "does it exist" and "is it a directory"
+    try:
+        st = os.stat(path_str)
+    except OSError:
+        print(f"Error: Path '{path_str}' does not exist")
         sys.exit(1)
+
+    is_dir = stat.S_ISDIR(st.st_mode)
+    path = Path(path_str)
     
     if not check_exiftool():
         print("Error: exiftool is not installed.")
@@ -964,24 +1665,25 @@ def main():
         print(f"Checking keywords in: {path}")
         print("=" * 70)
         
-        if path.is_dir():
+        if is_dir:
             file_count = check_keywords_folder(path)
             print("\n" + "=" * 70)
             print(f"Files checked: {file_count}")
         else:
-            if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
-                print(f"Error: File extension '{path.suffix}' is not supported")
+            ext = os.path.splitext(path_str)[1].lower()
+            if ext not in SUPPORTED_EXTENSIONS:
+                print(f"Error: File extension '{ext}' is not supported")
                 sys.exit(1)
             
             print(f"\n{path}")
-            display_keywords(path)
+            display_keywords(path, session=_exiftool_daemon())
             print("\n" + "=" * 70)
         
         sys.exit(0)
     
     # Handle watch mode
     if args.watch:
-        if not path.is_dir():
+        if not is_dir:
             print("Error: Watch mode requires a directory path, not a file.")
             sys.exit(1)
         
@@ -997,21 +1699,24 @@ def main():
     
     strip_prefixes = not args.keep_prefixes if hasattr(args, 'keep_prefixes') else STRIP_HIERARCHICAL_PREFIXES
     
-    if path.is_dir():
+    if is_dir:
         processed, tagged, errors = process_folder(
             path,
             dry_run=args.dry_run,
             merge=not args.replace,
             verbose=args.verbose,
-            strip_prefixes=strip_prefixes
+            strip_prefixes=strip_prefixes,
+            jobs=args.jobs,
+            force=args.force
         )
     else:
-        if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
-            print(f"Error: File extension '{path.suffix}' is not supported")
+        ext = os.path.splitext(path_str)[1].lower()
+        if ext not in SUPPORTED_EXTENSIONS:
+            print(f"Error: File extension '{ext}' is not supported")
             sys.exit(1)
         
         processed = 1
-        success, keywords = process_file(path, dry_run=args.dry_run, merge=not args.replace, strip_prefixes=strip_prefixes)
+        success, keywords = process_file(path, dry_run=args.dry_run, merge=not args.replace, strip_prefixes=strip_prefixes, session=_exiftool_daemon())
         tagged = 1 if keywords else 0
         errors = 0 if success else 1
         
@@ -6,75 +6,286 @@ A macOS menu bar application for managing the keyword synchronization service.
 """
 
 import rumps
+from PyObjCTools import AppHelper
 import subprocess
 import sys
 import threading
+import atexit
 import os
 import fcntl
+from concurrent.futures import ThreadPoolExecutor
+import re
+import signal
 import time
 from pathlib import Path
-from datetime import datetime
 
 # Import from the main script
 import bridge_keywords_to_tags as bkt
 
+# NSMenu delegate that refreshes the service status right before the menu is
+# displayed, so we don't have to poll aggressively in the background.
+# rumps is built on PyObjC, so Foundation is available whenever rumps is.
+try:
+    from Foundation import NSObject
+
+    class _MenuUpdateDelegate(NSObject):
+        def menuNeedsUpdate_(self, menu):
+            app = getattr(self, 'app', None)
+            if app is not None:
+                app._finish_menu_build()
+                app.update_status(None)
+except Exception:
+    _MenuUpdateDelegate = None
+
+
+# Startup logging costs a write syscall per line on every cold launch;
+# keep it only when explicitly debugging
+_DEBUG = os.environ.get("BRIDGE_DEBUG")
+
+
+def _log(msg):
+    if _DEBUG:
+        print(msg)
+
+
+# Short-lived cache around bkt.service_status() so bursts of menu activity
+# don't each fork a launchctl subprocess
+_status_cache = {'value': None, 'ts': 0.0}
+
+
+def cached_service_status(ttl: float = 2.0) -> str:
+    """Return the service status, reusing a recent result when available."""
+    now = time.monotonic()
+    if _status_cache['value'] is not None and now - _status_cache['ts'] < ttl:
+        return _status_cache['value']
+    status = bkt.service_status()
+    _status_cache['value'] = status
+    _status_cache['ts'] = now
+    return status
+
+
+def invalidate_status_cache():
+    """Force the next cached_service_status() call to re-query launchctl."""
+    _status_cache['ts'] = 0.0
+    _status_cache['value'] = None
+
+
+def _fast_is_running() -> bool:
+    """Cheap liveness probe via the watcher's PID file.
+
+    A signal-0 kill is a syscall instead of a launchctl fork; the heavier
+    service_status() is only needed to distinguish stopped vs not-installed.
+    """
+    try:
+        pid = int(bkt.get_pid_file_path().read_text())
+        os.kill(pid, 0)
+        return True
+    except (OSError, ValueError):
+        return False
+
+
+# Matches the single configuration line toggled by show_marker_status
+_MARKER_RE = re.compile(r'^MARKER_KEYWORD\s*=')
+
+# launchd plist controlling auto-start of this menu bar app
+_PLIST_PATH = Path.home() / "Library" / "LaunchAgents" / "com.user.bridge-menubar.plist"
+
+# Sibling scripts, resolved once instead of per menu click
+_HERE = Path(__file__).resolve().parent
+_BKT_SCRIPT = _HERE / "bridge_keywords_to_tags.py"
+_DASHBOARD_SCRIPT = _HERE / "bridge_dashboard_gui.py"
+
+# Menu labels for the marker toggle, indexed by bool(bkt.MARKER_KEYWORD)
+_MARKER_LABELS = ("all enabled", "sync enabled")
+
+# AppleScript resolving the frontmost Finder directory; defined once and fed
+# to osascript via stdin rather than re-built as an -e argument per click
+_FINDER_DIR_SCRIPT = '''
+tell application "Finder"
+    if (count of Finder windows) is 0 then
+        return POSIX path of (desktop as alias)
+    else
+        return POSIX path of (target of front window as alias)
+    end if
+end tell
+'''
+
+_PLIST_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>com.user.bridge-menubar</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>/usr/bin/python3</string>
+        <string>{script_path}</string>
+    </array>
+    <key>RunAtLoad</key>
+    <true/>
+    <key>KeepAlive</key>
+    <false/>
+</dict>
+</plist>
+'''
+
+
+def cached_watch_paths() -> list:
+    """Get the configured watch paths.
+
+    The directory list lives in the JSON sidecar and
+    load_watch_directories() already caches it on the sidecar's mtime,
+    so dashboard edits show up here without any extra cache layer.
+    """
+    return bkt.get_configured_watch_paths()
+
+
 class BridgeMenuBarApp(rumps.App):
     def __init__(self):
-        print("Initializing BridgeMenuBarApp...")
+        _log("Initializing BridgeMenuBarApp...")
         super(BridgeMenuBarApp, self).__init__(
             "Bridge",  # More visible text
             icon=None,
             quit_button=None
         )
-        print("rumps.App initialized")
-        
+        _log("rumps.App initialized")
+
+        # One small shared pool instead of a fresh thread per menu click;
+        # also serializes handlers that rewrite the config file
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='bridge-bg')
+
         # Track service state
         self.is_running = False
-        self.last_check = None
+        self._last_check_mono = None
+        self._last_update_mono = 0.0
         self.auto_start_enabled = self.check_auto_start()
-        print("State variables initialized")
+        _log("State variables initialized")
         
-        # Build menu
-        print("Building menu...")
+        # Build only the essential menu items up front so the icon appears
+        # quickly; the long tail is filled in by _finish_menu_build
+        _log("Building menu...")
         # Set initial marker status
-        marker_text = "sync enabled" if bkt.MARKER_KEYWORD else "all enabled"
-        auto_start_text = "Automatically open ✓" if self.auto_start_enabled else "Automatically open"
+        marker_text = _MARKER_LABELS[bool(bkt.MARKER_KEYWORD)]
+        # Keep a direct reference so callbacks can update the title without
+        # scanning the whole menu
+        self._marker_item = rumps.MenuItem(marker_text, callback=self.show_marker_status)
+        self._menu_fully_built = False
         self.menu = [
             rumps.MenuItem("Service Status", callback=self.show_status),
             rumps.MenuItem("Show Config", callback=self.show_config),
-            rumps.MenuItem(marker_text, callback=self.show_marker_status),
+            self._marker_item,
             None,  # Separator
             rumps.MenuItem("Start Service", callback=self.start_service),
             rumps.MenuItem("Stop Service", callback=self.stop_service),
             rumps.MenuItem("Restart Service", callback=self.restart_service),
             None,  # Separator
-            rumps.MenuItem("View Logs", callback=self.view_logs),
-            rumps.MenuItem("Open Configuration", callback=self.open_config),
-            rumps.MenuItem("Dashboard", callback=self.open_dashboard),
-            None,  # Separator
-            rumps.MenuItem("Process Current Directory", callback=self.process_current),
-            rumps.MenuItem("Stop Processing", callback=self.stop_processing),
-            rumps.MenuItem(auto_start_text, callback=self.toggle_auto_start),
-            None,  # Separator
             rumps.MenuItem("About", callback=self.show_about),
             rumps.MenuItem("Quit", callback=self.quit_app),
         ]
-        print("Menu built")
-        
-        # Start status update timer
-        print("Starting timer...")
-        self.timer = rumps.Timer(self.update_status, 5)
+        _log("Menu built")
+
+        # Populate the remaining entries shortly after launch (or on first
+        # menu open via the delegate, whichever comes first)
+        def build_rest(timer):
+            timer.stop()
+            self._finish_menu_build()
+        self._menu_build_timer = rumps.Timer(build_rest, 0.1)
+        self._menu_build_timer.start()
+
+        # Refresh status just-in-time when the menu is about to open,
+        # instead of polling every few seconds while idle
+        _log("Installing menu delegate...")
+        self._menu_delegate = None
+        if _MenuUpdateDelegate is not None:
+            try:
+                self._menu_delegate = _MenuUpdateDelegate.alloc().init()
+                self._menu_delegate.app = self
+                self.menu._menu.setDelegate_(self._menu_delegate)
+            except Exception:
+                self._menu_delegate = None
+
+        # Refresh on process launch/termination events so external service
+        # state changes show up without waiting for the next poll
+        _log("Registering workspace observer...")
+        self._workspace_observers = []
+        self._register_workspace_observer()
+
+        # Slow fallback timer keeps the title glyph ("Bridge ✓/○") roughly
+        # current even if the menu is never opened
+        _log("Starting timer...")
+        self.timer = rumps.Timer(self.update_status, 60)
         self.timer.start()
-        print("Timer started")
-        
+        _log("Timer started")
+
         # Initial status check
-        print("Doing initial status check...")
+        _log("Doing initial status check...")
         self.update_status(None)
-        print("Initialization complete!")
+        _log("Initialization complete!")
     
+    def _finish_menu_build(self):
+        """Insert the rarely-used menu entries deferred from __init__."""
+        if self._menu_fully_built:
+            return
+        self._menu_fully_built = True
+        auto_start_text = "Automatically open ✓" if self.auto_start_enabled else "Automatically open"
+        for item in (
+            rumps.MenuItem("View Logs", callback=self.view_logs),
+            rumps.MenuItem("Open Configuration", callback=self.open_config),
+            rumps.MenuItem("Dashboard", callback=self.open_dashboard),
+            rumps.MenuItem("Process Current Directory", callback=self.process_current),
+            rumps.MenuItem("Stop Processing", callback=self.stop_processing),
+            rumps.MenuItem(auto_start_text, callback=self.toggle_auto_start),
+        ):
+            self.menu.insert_before("About", item)
+
+    def _register_workspace_observer(self):
+        """Subscribe to NSWorkspace launch/terminate notifications.
+
+        Push-over-poll: when the watcher (or anything Python/bridge related)
+        starts or exits, invalidate the status cache and refresh immediately.
+        Not every launchd job posts these notifications, so the fallback
+        timer stays in place; this just makes the common case instant.
+        """
+        try:
+            from AppKit import (
+                NSWorkspace,
+                NSWorkspaceDidLaunchApplicationNotification,
+                NSWorkspaceDidTerminateApplicationNotification,
+            )
+        except Exception:
+            return
+
+        def on_app_event(note):
+            try:
+                info = note.userInfo() or {}
+                app = info.get('NSWorkspaceApplicationKey')
+                name = str(app.localizedName()).lower() if app is not None else ''
+                if 'bridge' in name or 'python' in name:
+                    invalidate_status_cache()
+                    self._refresh_status_soon()
+            except Exception:
+                pass
+
+        try:
+            center = NSWorkspace.sharedWorkspace().notificationCenter()
+            for notification_name in (NSWorkspaceDidLaunchApplicationNotification,
+                                      NSWorkspaceDidTerminateApplicationNotification):
+                observer = center.addObserverForName_object_queue_usingBlock_(
+                    notification_name, None, None, on_app_event)
+                self._workspace_observers.append(observer)
+        except Exception:
+            self._workspace_observers = []
+
     def update_status(self, _):
-        """Update service status periodically."""
-        status = bkt.service_status()
+        """Update service status (on menu open, or from the fallback timer)."""
+        # Debounce: menu-open, timer and post-action refreshes can land
+        # back-to-back; coalesce anything within 250 ms
+        now = time.monotonic()
+        if now - self._last_update_mono < 0.25:
+            return
+        self._last_update_mono = now
+
+        status = 'running' if _fast_is_running() else cached_service_status()
         
         if status == 'running':
             self.is_running = True
@@ -95,24 +306,16 @@ class BridgeMenuBarApp(rumps.App):
             self.menu["Stop Service"].set_callback(None)  # Disable
             self.menu["Restart Service"].set_callback(None)  # Disable
         
-        # Update marker keyword status in menu
-        old_marker_text = "sync enabled" if bkt.MARKER_KEYWORD else "all enabled"
-        new_marker_text = "sync enabled" if bkt.MARKER_KEYWORD else "all enabled"
-        # Find and update the marker menu item
-        for item in self.menu.values():
-            if hasattr(item, 'title') and item.title in ["sync enabled", "all enabled"]:
-                item.title = new_marker_text
-                break
-        
-        self.last_check = datetime.now()
+        # Monotonic stamp; show_status formats it only when actually displayed
+        self._last_check_mono = time.monotonic()
     
     @rumps.clicked("Service Status")
     def show_status(self, _):
         """Show detailed service status."""
         def show_status_async():
             try:
-                status = bkt.service_status()
-                watch_paths = bkt.get_configured_watch_paths()
+                status = cached_service_status()
+                watch_paths = cached_watch_paths()
                 
                 if status == 'running':
                     status_text = "🟢 Running"
@@ -124,11 +327,16 @@ class BridgeMenuBarApp(rumps.App):
                     status_text = "❓ Unknown"
                 
                 subtitle = f"{len(watch_paths)} director{'y' if len(watch_paths) == 1 else 'ies'}" if watch_paths else "No directories"
-                
+
+                if self._last_check_mono is not None:
+                    last_checked = f"{int(time.monotonic() - self._last_check_mono)}s ago"
+                else:
+                    last_checked = "Never"
+
                 rumps.notification(
                     title=f"Bridge: {status_text}",
                     subtitle=subtitle,
-                    message=f"Last checked: {self.last_check.strftime('%H:%M:%S') if self.last_check else 'Never'}"
+                    message=f"Last checked: {last_checked}"
                 )
             except Exception as e:
                 rumps.notification(
@@ -137,9 +345,8 @@ class BridgeMenuBarApp(rumps.App):
                     message=str(e)
                 )
         
-        # Run in background thread to avoid blocking UI
-        thread = threading.Thread(target=show_status_async, daemon=True)
-        thread.start()
+        # Run in the shared background pool to avoid blocking UI
+        self._pool.submit(show_status_async)
     
     
     @rumps.clicked("Show Config")
@@ -147,7 +354,7 @@ class BridgeMenuBarApp(rumps.App):
         """Show configuration details."""
         def show_config_async():
             try:
-                watch_paths = bkt.get_configured_watch_paths()
+                watch_paths = cached_watch_paths()
                 
                 # Build configuration summary
                 strip_text = f"Strip prefixes: {'Yes' if bkt.STRIP_HIERARCHICAL_PREFIXES else 'No'}"
@@ -176,49 +383,44 @@ class BridgeMenuBarApp(rumps.App):
                     message=f"Failed to load config: {str(e)}"
                 )
         
-        # Run in background thread
-        thread = threading.Thread(target=show_config_async, daemon=True)
-        thread.start()
+        self._pool.submit(show_config_async)
     
     def show_marker_status(self, sender):
         """Toggle marker keyword mode between sync and all."""
         def toggle_async():
             try:
-                # Read the current config file
-                script_path = Path(__file__).parent / "bridge_keywords_to_tags.py"
-                with open(script_path, 'r') as f:
-                    content = f.read()
-                
+                script_path = _BKT_SCRIPT
+
                 # Toggle the marker keyword
                 if bkt.MARKER_KEYWORD is None:
-                    # Switch to sync mode
-                    new_content = content.replace(
-                        'MARKER_KEYWORD = None',
-                        'MARKER_KEYWORD = "sync"'
-                    )
-                    new_mode = "sync enabled"
+                    replacement = 'MARKER_KEYWORD = "sync"\n'
+                    new_mode = _MARKER_LABELS[1]
                     message = "Only files with 'sync' keyword will be processed"
                     bkt.MARKER_KEYWORD = "sync"
                 else:
-                    # Switch to all mode
-                    new_content = content.replace(
-                        'MARKER_KEYWORD = "sync"',
-                        'MARKER_KEYWORD = None'
-                    )
-                    new_mode = "all enabled"
+                    replacement = 'MARKER_KEYWORD = None\n'
+                    new_mode = _MARKER_LABELS[0]
                     message = "All files with XMP keywords will be processed"
                     bkt.MARKER_KEYWORD = None
-                
-                # Write the updated config
-                with open(script_path, 'w') as f:
-                    f.write(new_content)
+
+                # Rewrite only the MARKER_KEYWORD line, streaming through a
+                # temp file so the script is replaced atomically
+                tmp_path = script_path.with_suffix('.py.tmp')
+                with open(script_path, 'r') as src, open(tmp_path, 'w') as dst:
+                    for line in src:
+                        dst.write(replacement if _MARKER_RE.match(line) else line)
+                # Carry the script's mode over so the rename doesn't drop
+                # its executable bit
+                os.chmod(tmp_path, os.stat(script_path).st_mode)
+                os.replace(tmp_path, script_path)
                 
                 # Update menu item title
                 sender.title = new_mode
                 
                 # Automatically restart service if it's running
-                if bkt.service_status() == 'running':
+                if cached_service_status() == 'running':
                     bkt.service_restart()
+                    invalidate_status_cache()
                     restart_msg = " Service restarted."
                 else:
                     restart_msg = ""
@@ -235,85 +437,111 @@ class BridgeMenuBarApp(rumps.App):
                     message=f"Failed to toggle mode: {str(e)}"
                 )
         
-        # Run in background thread
-        thread = threading.Thread(target=toggle_async, daemon=True)
-        thread.start()
+        self._pool.submit(toggle_async)
     
+    def _refresh_status_soon(self):
+        """Schedule a status refresh on the main thread.
+
+        Worker threads must not touch AppKit directly; callAfter marshals
+        the update onto the main run loop. (A rumps.Timer won't do here:
+        it registers on the calling thread's run loop, which a pool worker
+        never spins, so the timer would never fire.)
+        """
+        AppHelper.callAfter(self._update_status_force)
+
+    def _update_status_force(self):
+        """Refresh immediately, bypassing the debounce (after service actions)."""
+        self._last_update_mono = 0.0
+        self.update_status(None)
+
     @rumps.clicked("Start Service")
     def start_service(self, _):
         """Start the background service."""
-        try:
-            script_path = Path(__file__).parent / "bridge_keywords_to_tags.py"
-            
-            # Check configuration first
-            watch_paths = bkt.get_configured_watch_paths()
-            if not watch_paths:
-                rumps.notification(
-                    title="No Directories Configured",
-                    subtitle="Bridge Keywords to Tags",
-                    message="Edit WATCH_DIRECTORIES in the script first"
-                )
-                return
-            
-            # Install if needed
-            if bkt.service_status() == 'not-installed':
-                if bkt.service_install(script_path, autostart=False):
+        def start_async():
+            try:
+                script_path = _BKT_SCRIPT
+
+                # Check configuration first
+                watch_paths = cached_watch_paths()
+                if not watch_paths:
+                    rumps.notification(
+                        title="No Directories Configured",
+                        subtitle="Bridge Keywords to Tags",
+                        message="Edit WATCH_DIRECTORIES in the script first"
+                    )
+                    return
+
+                # Install if needed
+                if cached_service_status() == 'not-installed':
+                    if bkt.service_install(script_path, autostart=False):
+                        rumps.notification(
+                            title="Service Installed",
+                            subtitle="Bridge Keywords to Tags",
+                            message="Service installed successfully. Starting..."
+                        )
+
+                # Start the service
+                if bkt.service_start():
+                    invalidate_status_cache()
                     rumps.notification(
-                        title="Service Installed",
+                        title="Service Started",
                         subtitle="Bridge Keywords to Tags",
-                        message="Service installed successfully. Starting..."
+                        message=f"Now watching {len(watch_paths)} director{'y' if len(watch_paths) == 1 else 'ies'}"
                     )
-            
-            # Start the service
-            if bkt.service_start():
+                    self._refresh_status_soon()
+            except Exception as e:
                 rumps.notification(
-                    title="Service Started",
+                    title="Error Starting Service",
                     subtitle="Bridge Keywords to Tags",
-                    message=f"Now watching {len(watch_paths)} director{'y' if len(watch_paths) == 1 else 'ies'}"
+                    message=str(e)
                 )
-                self.update_status(None)
-        except Exception as e:
-            rumps.notification(
-                title="Error Starting Service",
-                subtitle="Bridge Keywords to Tags",
-                message=str(e)
-            )
-    
+
+        # Run in the background pool to keep the menu bar responsive
+        self._pool.submit(start_async)
+
     @rumps.clicked("Stop Service")
     def stop_service(self, _):
         """Stop the background service."""
-        try:
-            if bkt.service_stop():
+        def stop_async():
+            try:
+                if bkt.service_stop():
+                    invalidate_status_cache()
+                    rumps.notification(
+                        title="Service Stopped",
+                        subtitle="Bridge Keywords to Tags",
+                        message="Service stopped successfully"
+                    )
+                    self._refresh_status_soon()
+            except Exception as e:
                 rumps.notification(
-                    title="Service Stopped",
+                    title="Error Stopping Service",
                     subtitle="Bridge Keywords to Tags",
-                    message="Service stopped successfully"
+                    message=str(e)
                 )
-                self.update_status(None)
-        except Exception as e:
-            rumps.notification(
-                title="Error Stopping Service",
-                subtitle="Bridge Keywords to Tags",
-                message=str(e)
-            )
-    
+
+        self._pool.submit(stop_async)
+
     @rumps.clicked("Restart Service")
     def restart_service(self, _):
         """Restart the background service."""
-        try:
-            if bkt.service_restart():
+        def restart_async():
+            try:
+                if bkt.service_restart():
+                    invalidate_status_cache()
+                    rumps.notification(
+                        title="Service Restarted",
+                        subtitle="Bridge Keywords to Tags",
+                        message="Service restarted successfully"
+                    )
+                    self._refresh_status_soon()
+            except Exception as e:
                 rumps.notification(
-                    title="Service Restarted",
+                    title="Error Restarting Service",
                     subtitle="Bridge Keywords to Tags",
-                    message="Service restarted successfully"
+                    message=str(e)
                 )
-                self.update_status(None)
-        except Exception as e:
-            rumps.notification(
-                title="Error Restarting Service",
-                subtitle="Bridge Keywords to Tags",
-                message=str(e)
-            )
+
+        self._pool.submit(restart_async)
     
     @rumps.clicked("View Logs")
     def view_logs(self, _):
@@ -328,15 +556,16 @@ class BridgeMenuBarApp(rumps.App):
             )
             return
         
-        # Open in Console.app
-        subprocess.run(['open', '-a', 'Console', str(log_path)])
+        # Open in Console.app without blocking the UI thread on fork/exec
+        subprocess.Popen(['open', '-a', 'Console', str(log_path)],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     @rumps.clicked("Open Configuration")
     def open_config(self, _):
         """Open the configuration file in default editor."""
-        script_path = Path(__file__).parent / "bridge_keywords_to_tags.py"
-        subprocess.run(['open', '-t', str(script_path)])
-        
+        subprocess.Popen(['open', '-t', str(_BKT_SCRIPT)],
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
         rumps.notification(
             title="Configuration Opened",
             subtitle="Bridge Keywords to Tags",
@@ -346,8 +575,8 @@ class BridgeMenuBarApp(rumps.App):
     @rumps.clicked("Dashboard")
     def open_dashboard(self, _):
         """Open the GUI dashboard."""
-        script_path = Path(__file__).parent / "bridge_dashboard_gui.py"
-        
+        script_path = _DASHBOARD_SCRIPT
+
         if not script_path.exists():
             rumps.notification(
                 title="Dashboard Not Found",
@@ -356,10 +585,14 @@ class BridgeMenuBarApp(rumps.App):
             )
             return
         
-        # Use a simple shell command to launch and bring to front
+        # Launch directly (no shell fork) and bring to front shortly after.
         # Use Anaconda Python which has working tkinter
-        cmd = f'cd "{script_path.parent}" && /opt/anaconda3/bin/python3 "{script_path}" & sleep 0.5 && osascript -e \'tell application "Python" to activate\' 2>/dev/null || true'
-        subprocess.Popen(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        subprocess.Popen(['/opt/anaconda3/bin/python3', str(script_path)],
+                         cwd=str(_HERE),
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        threading.Timer(0.5, lambda: subprocess.Popen(
+            ['osascript', '-e', 'tell application "Python" to activate'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)).start()
     
     @rumps.clicked("Process Current Directory")
     def process_current(self, _):
@@ -367,17 +600,9 @@ class BridgeMenuBarApp(rumps.App):
         def process_async():
             try:
                 # Get current Finder directory
-                applescript = '''
-                tell application "Finder"
-                    if (count of Finder windows) is 0 then
-                        return POSIX path of (desktop as alias)
-                    else
-                        return POSIX path of (target of front window as alias)
-                    end if
-                end tell
-                '''
                 result = subprocess.run(
-                    ['osascript', '-e', applescript],
+                    ['osascript', '-'],
+                    input=_FINDER_DIR_SCRIPT,
                     capture_output=True,
                     text=True,
                     timeout=5
@@ -394,9 +619,8 @@ class BridgeMenuBarApp(rumps.App):
                 current_dir = Path(result.stdout.strip())
                 
                 # Run processing in background
-                script_path = Path(__file__).parent / "bridge_keywords_to_tags.py"
                 subprocess.Popen([
-                    'python3', str(script_path), str(current_dir), '-v'
+                    'python3', str(_BKT_SCRIPT), str(current_dir), '-v'
                 ])
                 
                 rumps.notification(
@@ -412,33 +636,55 @@ class BridgeMenuBarApp(rumps.App):
                     message=f"Failed to process: {str(e)}"
                 )
         
-        # Run in background thread
-        thread = threading.Thread(target=process_async, daemon=True)
-        thread.start()
+        self._pool.submit(process_async)
     
     @rumps.clicked("Stop Processing")
     def stop_processing(self, _):
         """Stop any running bridge_keywords_to_tags.py processing."""
         def stop_async():
             try:
-                # Find and kill any running bridge_keywords_to_tags.py processes
+                # Find running bridge_keywords_to_tags.py processes; -l includes
+                # the command line so we can filter out false positives
                 result = subprocess.run(
-                    ['pgrep', '-f', 'bridge_keywords_to_tags.py'],
+                    ['pgrep', '-fl', 'bridge_keywords_to_tags.py'],
                     capture_output=True,
                     text=True,
                     timeout=2
                 )
-                
+
                 if result.returncode == 0 and result.stdout.strip():
-                    pids = result.stdout.strip().split('\n')
+                    # Never signal ourselves or the menu bar app, whose argv can
+                    # also mention the script name
+                    own_pid = os.getpid()
+                    victims = []
+                    for line in result.stdout.strip().split('\n'):
+                        pid_str, _, cmdline = line.partition(' ')
+                        try:
+                            pid = int(pid_str)
+                        except ValueError:
+                            continue
+                        if pid == own_pid or 'bridge_menubar.py' in cmdline:
+                            continue
+                        victims.append(pid)
+
                     killed_count = 0
-                    for pid in pids:
+                    for pid in victims:
+                        # Signal directly instead of forking a kill subprocess per PID
                         try:
-                            subprocess.run(['kill', pid], timeout=2)
+                            os.kill(pid, signal.SIGTERM)
                             killed_count += 1
-                        except:
+                        except (ProcessLookupError, PermissionError):
                             pass
-                    
+
+                    # Give workers a moment to exit cleanly, then force-kill survivors
+                    if killed_count > 0:
+                        time.sleep(0.5)
+                        for pid in victims:
+                            try:
+                                os.kill(pid, signal.SIGKILL)
+                            except (ProcessLookupError, PermissionError):
+                                pass
+
                     if killed_count > 0:
                         rumps.notification(
                             title="Processing Stopped",
@@ -465,19 +711,17 @@ class BridgeMenuBarApp(rumps.App):
                 )
         
         # Run in background thread
-        thread = threading.Thread(target=stop_async, daemon=True)
-        thread.start()
+        self._pool.submit(stop_async)
     
     def check_auto_start(self):
         """Check if app is set to auto-start."""
-        plist_path = Path.home() / "Library" / "LaunchAgents" / "com.user.bridge-menubar.plist"
-        return plist_path.exists()
-    
+        return _PLIST_PATH.exists()
+
     def toggle_auto_start(self, sender):
         """Toggle auto-start at login."""
         def toggle_async():
             try:
-                plist_path = Path.home() / "Library" / "LaunchAgents" / "com.user.bridge-menubar.plist"
+                plist_path = _PLIST_PATH
                 script_path = Path(__file__).resolve()
                 
                 if self.auto_start_enabled:
@@ -495,27 +739,8 @@ class BridgeMenuBarApp(rumps.App):
                 else:
                     # Enable auto-start
                     plist_path.parent.mkdir(parents=True, exist_ok=True)
-                    plist_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.user.bridge-menubar</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>/usr/bin/python3</string>
-        <string>{script_path}</string>
-    </array>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>KeepAlive</key>
-    <false/>
-</dict>
-</plist>
-'''
-                    with open(plist_path, 'w') as f:
-                        f.write(plist_content)
-                    
+                    plist_path.write_text(_PLIST_TEMPLATE.format(script_path=script_path))
+
                     subprocess.run(['launchctl', 'load', str(plist_path)], check=True)
                     self.auto_start_enabled = True
                     sender.title = "Automatically open ✓"
@@ -531,7 +756,7 @@ class BridgeMenuBarApp(rumps.App):
                     message=f"Failed to toggle auto-start: {str(e)}"
                 )
         
-        threading.Thread(target=toggle_async, daemon=True).start()
+        self._pool.submit(toggle_async)
     
     @rumps.clicked("About")
     def show_about(self, _):
@@ -545,26 +770,39 @@ class BridgeMenuBarApp(rumps.App):
     @rumps.clicked("Quit")
     def quit_app(self, _):
         """Quit the menu bar app."""
+        self._pool.shutdown(wait=False)
         rumps.quit_application()
 
 
+_LOCK_PATH = b"/tmp/bridge_menubar.lock"
+
+
 def main():
     # Check if running on macOS
     if sys.platform != 'darwin':
         print("Error: This menu bar app only works on macOS")
         sys.exit(1)
-    
+
     # Prevent multiple instances
-    lock_file = Path('/tmp/bridge_menubar.lock')
     try:
-        lock_fd = os.open(str(lock_file), os.O_CREAT | os.O_RDWR)
+        lock_fd = os.open(_LOCK_PATH, os.O_CREAT | os.O_RDWR, 0o644)
         fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
     except (IOError, OSError):
         print("Another instance is already running. Exiting.")
         sys.exit(1)
-    
-    # Start the app
+
+    # Release the lock on exit rather than leaking the descriptor
+    def release_lock():
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+        except OSError:
+            pass
+    atexit.register(release_lock)
+
+    # Start the app; keep the fd referenced so it isn't GC'd
     app = BridgeMenuBarApp()
+    app._lock_fd = lock_fd
     app.run()
 
 